@@ -51,7 +51,7 @@ class Question:
     multi_select: bool
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate an answer key CSV and printable PDF from Canvas QTI exports.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -85,7 +85,7 @@ def parse_args() -> argparse.Namespace:
         "--zip",
         help="Optional Canvas QTI export .zip. When supplied, files are auto-detected unless explicitly overridden.",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def resolve_input_path(path_arg: Optional[str], base_dir: Optional[Path]) -> Optional[Path]:
@@ -336,8 +336,8 @@ def maybe_print_manifest_info(manifest_path: Optional[Path]) -> None:
         print(f"Note: unable to parse imsmanifest ({exc}).")
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
     temp_dir: Optional[tempfile.TemporaryDirectory] = None
     base_dir: Optional[Path] = None
 
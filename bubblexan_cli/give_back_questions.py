@@ -11,7 +11,7 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Optional, Sequence
 
 import pandas as pd
 
@@ -29,7 +29,7 @@ class AdjustmentRecord:
     student_count: int
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     """Configure CLI arguments."""
     parser = argparse.ArgumentParser(
         description="Give back specific questions by overriding results and chaining grade.py.",
@@ -45,7 +45,12 @@ def parse_args() -> argparse.Namespace:
         help="Directory where <version>_results.csv and graded reports will be written.",
     )
     parser.add_argument("--log", help="Optional log file capturing the adjustment summary.")
-    return parser.parse_args()
+    parser.add_argument(
+        "--python",
+        default=sys.executable or "python3",
+        help="Python interpreter used to run the chained grade.py.",
+    )
+    return parser.parse_args(argv)
 
 
 def normalize_version(version: str) -> str:
@@ -164,6 +169,7 @@ def run_grade_pipeline(
     answer_key_path: Path,
     final_csv: Path,
     final_xlsx: Path,
+    python_executable: str,
 ) -> None:
     """Call grade.py using a temporary directory, then move outputs to versioned names."""
     grade_script = Path(__file__).with_name("grade.py")
@@ -173,17 +179,18 @@ def run_grade_pipeline(
     with TemporaryDirectory(prefix="give_back_", dir=final_csv.parent) as tmp_dir:
         tmp_dir_path = Path(tmp_dir)
         cmd = [
-            sys.executable or "python3",
+            python_executable,
             str(grade_script),
             str(adjusted_results_path),
             str(answer_key_path),
             "--output-dir",
             str(tmp_dir_path),
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True)
         if result.returncode != 0:
-            stderr = result.stderr.strip()
-            stdout = result.stdout.strip()
+            # Output is only shown on failure, so decode it here rather than on every run.
+            stderr = result.stderr.decode("utf-8", "replace").strip()
+            stdout = result.stdout.decode("utf-8", "replace").strip()
             combined = "\n".join(part for part in [stdout, stderr] if part)
             raise AdjustmentError(f"grade.py failed (exit code {result.returncode}). Details:\n{combined}")
 
@@ -211,9 +218,8 @@ def format_record(record: AdjustmentRecord) -> str:
     return f"{record.question_id}: updated {record.student_count} {suffix} ({record.row_count} rows)."
 
 
-def main() -> None:
-    """Entry point."""
-    args = parse_args()
+def run_adjustment(args: argparse.Namespace) -> None:
+    """Apply the give-backs described by ``args`` and write the versioned outputs."""
     results_path = Path(args.results)
     answer_key_path = Path(args.key)
     output_dir = Path(args.output_dir)
@@ -237,7 +243,7 @@ def main() -> None:
     records = apply_give_backs(results_df, answer_key_df, question_ids)
     results_df.to_csv(adjusted_results_path, index=False)
 
-    run_grade_pipeline(adjusted_results_path, answer_key_path, final_csv_path, final_xlsx_path)
+    run_grade_pipeline(adjusted_results_path, answer_key_path, final_csv_path, final_xlsx_path, args.python)
 
     summary_lines = [
         f"Version: {version}",
@@ -262,9 +268,15 @@ def main() -> None:
         print(f"Wrote log {log_path}")
 
 
-if __name__ == "__main__":
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point; ``argv`` defaults to ``sys.argv[1:]``."""
+    args = parse_args(argv)
     try:
-        main()
+        run_adjustment(args)
     except AdjustmentError as exc:
         print(f"Adjustment failed: {exc}", file=sys.stderr)
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
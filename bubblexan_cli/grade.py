@@ -6,7 +6,7 @@ from __future__ import annotations
 import argparse
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import pandas as pd
 
@@ -30,7 +30,7 @@ class GradingError(ValueError):
     """Raised when an input file is malformed."""
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     """Configure and parse CLI arguments."""
     parser = argparse.ArgumentParser(
         description="Grade student responses using Canvas multiple-select scoring.",
@@ -43,7 +43,7 @@ def parse_args() -> argparse.Namespace:
         default=".",
         help="Directory where graded_report.csv and graded_report.xlsx will be written.",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def _tokenize_answers(value: object) -> List[str]:
@@ -245,9 +245,9 @@ def write_outputs(graded_df: pd.DataFrame, stats_df: pd.DataFrame, output_dir: P
     print(f"Wrote {csv_path} and {xlsx_path}")
 
 
-def main() -> None:
-    """Entry point for the grading CLI."""
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point for the grading CLI; ``argv`` defaults to ``sys.argv[1:]``."""
+    args = parse_args(argv)
     responses_path = Path(args.responses_csv)
     answer_path = Path(args.answer_key_csv)
     output_dir = Path(args.output_dir)
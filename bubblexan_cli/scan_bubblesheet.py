@@ -17,7 +17,7 @@ import textwrap
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -63,7 +63,7 @@ class ScanResult:
     warnings: List[str]
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Scan bubble sheet images and export selections to CSV.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -94,7 +94,12 @@ def parse_args() -> argparse.Namespace:
         default="output",
         help="Directory for generated CSV/log files when using relative output paths.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Print a '[n/total] Scanning <name>' line before each image is processed.",
+    )
+    return parser.parse_args(argv)
 
 
 def load_layout(json_path: Path) -> LayoutGuide:
@@ -138,8 +143,14 @@ def load_layout(json_path: Path) -> LayoutGuide:
     )
 
 
-def iter_image_sources(image_path: Optional[Path], folder_path: Optional[Path]) -> Iterator[Tuple[str, np.ndarray]]:
+def iter_image_sources(
+    image_path: Optional[Path],
+    folder_path: Optional[Path],
+    progress: Optional[Callable[[int, int, str], None]] = None,
+) -> Iterator[Tuple[str, np.ndarray]]:
     if image_path:
+        if progress:
+            progress(1, 1, image_path.name)
         image = cv2.imread(str(image_path))
         if image is None:
             raise FileNotFoundError(f"Unable to read image: {image_path}")
@@ -149,11 +160,10 @@ def iter_image_sources(image_path: Optional[Path], folder_path: Optional[Path])
     assert folder_path is not None
     if folder_path.is_file() and folder_path.suffix.lower() == ".zip":
         with zipfile.ZipFile(folder_path) as zf:
-            for info in zf.infolist():
-                if info.is_dir():
-                    continue
-                if not is_image_file(info.filename):
-                    continue
+            entries = [info for info in zf.infolist() if not info.is_dir() and is_image_file(info.filename)]
+            for index, info in enumerate(entries, start=1):
+                if progress:
+                    progress(index, len(entries), info.filename)
                 data = zf.read(info.filename)
                 np_data = np.frombuffer(data, dtype=np.uint8)
                 image = cv2.imdecode(np_data, cv2.IMREAD_COLOR)
@@ -163,16 +173,21 @@ def iter_image_sources(image_path: Optional[Path], folder_path: Optional[Path])
     else:
         if not folder_path.exists():
             raise FileNotFoundError(f"Folder not found: {folder_path}")
-        for file_path in sorted(folder_path.rglob("*")):
-            if not file_path.is_file() or not is_image_file(file_path.name):
-                continue
+        files = [path for path in sorted(folder_path.rglob("*")) if path.is_file() and is_image_file(path.name)]
+        for index, file_path in enumerate(files, start=1):
+            rel_name = str(file_path.relative_to(folder_path))
+            if progress:
+                progress(index, len(files), rel_name)
             image = cv2.imread(str(file_path))
             if image is None:
                 continue
-            rel_name = str(file_path.relative_to(folder_path))
             yield (rel_name, image)
 
 
+def print_progress(index: int, total: int, name: str) -> None:
+    print(f"[{index}/{total}] Scanning {name}", flush=True)
+
+
 def is_image_file(name: str) -> bool:
     return Path(name).suffix.lower() in IMAGE_EXTENSIONS
 
@@ -594,8 +609,8 @@ def resolve_output_paths(output_arg: str, log_arg: Optional[str], output_dir: Pa
     return output_path, log_path
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
     json_path = Path(args.json)
     if not json_path.exists():
         raise FileNotFoundError(f"Layout JSON not found: {json_path}")
@@ -615,7 +630,8 @@ def main() -> None:
     results: List[ScanResult] = []
     log_entries: List[str] = []
 
-    for name, image in iter_image_sources(image_path, folder_path):
+    progress = print_progress if args.progress else None
+    for name, image in iter_image_sources(image_path, folder_path, progress):
         try:
             result = scan_image(name, image, layout, threshold, relative_threshold)
         except Exception as exc:  # noqa: BLE001
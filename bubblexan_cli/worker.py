@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Long-lived job runner for the Bubblexan Test Manager GUI.
+
+Started as ``worker.py <module>``: imports one CLI module up front, then reads
+one JSON job per stdin line (``{"argv": [...]}``) and runs that module's
+``main(argv)`` in-process, with stderr folded into stdout. After every job a single result line
+(``@@bubblexan-worker {"exit_code": N}``) is printed so the caller knows the
+job finished without the interpreter exiting. Closing stdin stops the worker.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import sys
+import traceback
+from types import ModuleType
+from typing import Sequence
+
+RESULT_PREFIX = "@@bubblexan-worker"
+SUPPORTED_MODULES = ("generate_test_from_qti", "give_back_questions", "grade", "scan_bubblesheet")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run CLI jobs read from stdin without restarting the interpreter.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("module", choices=SUPPORTED_MODULES, help="CLI module whose main() runs each job.")
+    return parser.parse_args()
+
+
+def run_job(module: ModuleType, argv: Sequence[str]) -> int:
+    """Run ``module.main(argv)`` and return the exit code the script would have produced."""
+    try:
+        module.main(list(argv))
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    except Exception:  # noqa: BLE001 - report like an uncaught error in the script
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def main() -> None:
+    args = parse_args()
+    module = importlib.import_module(args.module)
+    sys.argv = [module.__file__ or args.module]  # usage/errors name the real script
+    # Jobs write errors to stdout too, so the GUI receives one stream in the
+    # order it was produced and can show each line as soon as it arrives.
+    sys.stderr = sys.stdout
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            argv = json.loads(line)["argv"]
+        except (ValueError, KeyError, TypeError) as exc:
+            print(f"Invalid job request: {exc}", file=sys.stderr)
+            exit_code = 2
+        else:
+            exit_code = run_job(module, argv)
+        print(f"{RESULT_PREFIX} {json.dumps({'exit_code': exit_code})}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
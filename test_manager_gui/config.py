@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import csv
+import os
 import re
-import shutil
-import subprocess
+import stat
 import sys
-import tempfile
-import zipfile
-from pathlib import Path
-from typing import Iterable
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator
 
-GUI_ROOT = Path(__file__).resolve().parent
+GUI_ROOT = Path(os.path.realpath(__file__)).parent
 PROJECT_ROOT = GUI_ROOT.parent
-CLI_PATH = (PROJECT_ROOT / "bubblexan_cli").resolve()
-TEST_BUILD_PATH = (PROJECT_ROOT / "test_build").resolve()
+# os.path.realpath is what Path.resolve() wraps, minus its extra symlink-loop stat().
+CLI_PATH = Path(os.path.realpath(PROJECT_ROOT / "bubblexan_cli"))
+TEST_BUILD_PATH = Path(os.path.realpath(PROJECT_ROOT / "test_build"))
 
 _REQUIRED_CLI_SCRIPTS = [
     "generate_bubblesheet.py",
@@ -36,8 +37,13 @@ ACTIVE_TEST_NAME: str | None = None
 def validate_cli_environment(required_scripts: Iterable[str] | None = None) -> None:
     """Ensure the CLI folder, scripts, and test build path exist."""
 
-    scripts_to_check = list(required_scripts or _REQUIRED_CLI_SCRIPTS)
+    _validate_cli_environment_cached(tuple(required_scripts or _REQUIRED_CLI_SCRIPTS))
 
+
+@lru_cache(maxsize=None)
+def _validate_cli_environment_cached(scripts_to_check: tuple[str, ...]) -> None:
+    # The CLI checkout does not change during a GUI session, so each script set is
+    # checked once. Failures raise and are therefore never cached.
     if not CLI_PATH.exists():
         raise FileNotFoundError(
             f"Expected CLI directory at '{CLI_PATH}'. Verify the bubblexan_cli checkout."
@@ -54,15 +60,26 @@ def validate_cli_environment(required_scripts: Iterable[str] | None = None) -> N
     TEST_BUILD_PATH.mkdir(parents=True, exist_ok=True)
 
 
+def invalidate_cli_cache() -> None:
+    """Forget earlier successful ``validate_cli_environment`` checks."""
+
+    _validate_cli_environment_cached.cache_clear()
+
+
 def extract_exam_title(folder_name: str | None = None) -> str | None:
     """Return the instructor-provided exam title without the timestamp suffix."""
 
     candidate = folder_name or ACTIVE_TEST_NAME
     if not candidate:
         return None
-    parts = candidate.rsplit("_", 2)
+    return _exam_title(candidate)
+
+
+@lru_cache(maxsize=128)
+def _exam_title(folder_name: str) -> str | None:
+    parts = folder_name.rsplit("_", 2)
     if len(parts) != 3:
-        return candidate or None
+        return folder_name or None
     title = parts[0]
     return title or None
 
@@ -72,57 +89,120 @@ def active_test_folder() -> Path | None:
 
     if not ACTIVE_TEST_NAME:
         return None
-    return TEST_BUILD_PATH / ACTIVE_TEST_NAME
+    return _test_folder(ACTIVE_TEST_NAME)
+
+
+@lru_cache(maxsize=128)
+def _test_folder(folder_name: str) -> Path:
+    # Tabs ask for the active folder several times per refresh; reuse the joined Path.
+    return TEST_BUILD_PATH / folder_name
 
 
 validate_cli_environment()
 
 _META_NAME = "assessment_meta.xml"
 _MANIFEST_NAME = "imsmanifest.xml"
+# Classifies a QTI file name in any letter case: group 1 is assessment_meta.xml,
+# group 2 imsmanifest.xml and group 3 any other XML file (a primary candidate).
+_QTI_XML_PATTERN = re.compile(r"(assessment_meta\.xml)|(imsmanifest\.xml)|(.+\.xml)", re.IGNORECASE)
+_QTI_PRIMARY = 3
+_ZIP_SUFFIX_PATTERN = re.compile(r"\.zip\Z", re.IGNORECASE)
+# Asset folders inside a QTI export; searched only after the rest of the package.
+_QTI_ASSET_DIRS = frozenset({"resources", "media", "images"})
 _ANSWER_HEADERS = ["Question", "Correct_Answer", "Points"]
-_QUESTION_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
-_ANSWER_PATTERN = re.compile(r"^[a-e]$")
-_VERSION_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
-_PDF_EXTENSIONS = {".pdf"}
-_PNG_EXTENSIONS = {".png"}
-
-
-def _find_case_insensitive(folder: Path, target_name: str) -> Path | None:
-    target_lower = target_name.lower()
-    for path in folder.rglob("*"):
-        if path.is_file() and path.name.lower() == target_lower:
-            return path
-    return None
+_MISS_REPORT_FIELDS = ("Question", "Percent_Missed", "Missed_Count", "Total_Students")
+_QUESTION_PATTERN = re.compile(r"[A-Za-z0-9_-]+", re.ASCII)
+# One or more letters a-e separated by single commas, e.g. "b" or "b,c,d".
+_ANSWER_PATTERN = re.compile(r"[a-e](?:,[a-e])*", re.ASCII)
+_VERSION_PATTERN = re.compile(r"[A-Za-z0-9_-]+", re.ASCII)
+# Numbered versions: the last "_"-separated part of an "adjustment_..." name is the number.
+_ADJUSTMENT_NUMBER_PATTERN = re.compile(r"adjustment_(?:.*_)?(\d+)")
+_PNG_EXTENSIONS = frozenset({".png"})
+# Read buffer for CSV inputs; large enough that a big answer key or miss report
+# is read in a handful of syscalls rather than 8 KiB at a time.
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _scan_qti_folder(
+    folder: Path, *, primary_only: bool = False
+) -> tuple[Path | None, Path | None, Path | None]:
+    """Return (primary QTI XML, assessment_meta, imsmanifest) from a single walk of ``folder``.
+
+    The primary XML is the first ``*.xml`` that is neither support file; all three
+    match case-insensitively. Asset subtrees (``_QTI_ASSET_DIRS``) are pruned from
+    the first pass and only walked if something is still missing. The walk stops once
+    all three are found, or at the first primary XML when ``primary_only`` is set.
+    """
+
+    deferred: list[str] = []
+
+    def _walk(top: str | Path, prune: bool) -> Iterator[tuple[str, list[str]]]:
+        for dirpath, dirnames, filenames in os.walk(top):
+            if prune:
+                keep = []
+                for dirname in dirnames:
+                    if dirname.lower() in _QTI_ASSET_DIRS:
+                        deferred.append(os.path.join(dirpath, dirname))
+                    else:
+                        keep.append(dirname)
+                dirnames[:] = keep
+            yield dirpath, filenames
+
+    primary: Path | None = None
+    meta: Path | None = None
+    manifest: Path | None = None
+    # ``deferred`` is complete by the time the first walk is exhausted.
+    walk = chain(
+        _walk(folder, prune=True),
+        (entry for top in deferred for entry in _walk(top, prune=False)),
+    )
+    for dirpath, filenames in walk:
+        for filename in filenames:
+            match = _QTI_XML_PATTERN.fullmatch(filename)
+            if match is None:
+                continue
+            if match.lastindex == _QTI_PRIMARY:
+                if primary_only:
+                    return Path(dirpath) / filename, meta, manifest
+                primary = primary or Path(dirpath) / filename
+            elif match.lastindex == 1:
+                meta = meta or Path(dirpath) / filename
+            else:
+                manifest = manifest or Path(dirpath) / filename
+        if primary and meta and manifest:
+            break
+    return primary, meta, manifest
 
 
 def find_primary_qti_xml(folder: Path) -> Path | None:
     """Return the first XML file that is not assessment_meta or manifest."""
 
-    for path in folder.rglob("*.xml"):
-        name = path.name.lower()
-        if name in {_META_NAME, _MANIFEST_NAME}:
-            continue
-        return path
-    return None
+    return _scan_qti_folder(folder, primary_only=True)[0]
 
 
 def find_qti_support_files(folder: Path) -> tuple[Path | None, Path | None]:
     """Return assessment_meta and imsmanifest paths if they exist."""
 
-    return (
-        _find_case_insensitive(folder, _META_NAME),
-        _find_case_insensitive(folder, _MANIFEST_NAME),
-    )
+    _primary, meta, manifest = _scan_qti_folder(folder)
+    return meta, manifest
+
+
+def _user_path(source: str | os.PathLike[str]) -> Path:
+    """Return ``source`` as a Path with ``~`` expanded, reusing it when already a plain Path."""
+
+    if isinstance(source, Path) and not str(source).startswith("~"):
+        return source
+    return Path(source).expanduser()
 
 
 def validate_qti_source(source: Path) -> list[str]:
     """Validate that a folder or ZIP contains required QTI files."""
 
-    path = Path(source).expanduser()
+    path = _user_path(source)
     if not path.exists():
         return ["Selected path does not exist."]
     if path.is_file():
-        if path.suffix.lower() != ".zip":
+        if not _ZIP_SUFFIX_PATTERN.search(path.name):
             return ["Selected file must be a .zip archive."]
         return _validate_zip_contents(path)
     if path.is_dir():
@@ -131,50 +211,86 @@ def validate_qti_source(source: Path) -> list[str]:
 
 
 def _validate_folder_contents(folder: Path) -> list[str]:
+    primary, meta, manifest = _scan_qti_folder(folder)
     missing: list[str] = []
-    if not find_primary_qti_xml(folder):
+    if not primary:
         missing.append("QTI XML file (.xml)")
-    if not _find_case_insensitive(folder, _META_NAME):
+    if not meta:
         missing.append(_META_NAME)
-    if not _find_case_insensitive(folder, _MANIFEST_NAME):
+    if not manifest:
         missing.append(_MANIFEST_NAME)
     return missing
 
 
+def _zip_names(path: Path) -> tuple[str, ...]:
+    """Return the member names of the ZIP at ``path``, cached while the file is unchanged."""
+
+    info = path.stat()
+    return _zip_names_cached(os.fspath(path), info.st_mtime_ns, info.st_size)
+
+
+@lru_cache(maxsize=32)
+def _zip_names_cached(path: str, _mtime_ns: int, _size: int) -> tuple[str, ...]:
+    # The central directory is parsed once per archive version, however many validators ask.
+    import zipfile
+
+    with zipfile.ZipFile(path) as archive:
+        return tuple(archive.namelist())
+
+
 def _validate_zip_contents(zip_path: Path) -> list[str]:
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        with zipfile.ZipFile(zip_path) as archive:
-            archive.extractall(tmp_dir)
-        extracted_root = Path(tmp_dir)
-        return _validate_folder_contents(extracted_root)
+    # The archive's name list answers the same questions as a folder walk without extracting anything.
+    filenames = [PurePosixPath(name).name for name in _zip_names(zip_path) if not name.endswith("/")]
+    found: set[int] = set()
+    for filename in filenames:
+        match = _QTI_XML_PATTERN.fullmatch(filename)
+        if match is not None:
+            found.add(match.lastindex or 0)
+    missing: list[str] = []
+    if _QTI_PRIMARY not in found:
+        missing.append("QTI XML file (.xml)")
+    if 1 not in found:
+        missing.append(_META_NAME)
+    if 2 not in found:
+        missing.append(_MANIFEST_NAME)
+    return missing
 
 
 def validate_answer_key(csv_path: Path) -> list[str]:
     """Validate the structure of a manually provided answer key CSV."""
 
-    path = Path(csv_path).expanduser()
+    path = _user_path(csv_path)
     errors: list[str] = []
-    if not path.exists():
-        return ["Selected CSV file does not exist."]
     if path.suffix.lower() != ".csv":
         return ["Selected file must have a .csv extension."]
 
     try:
-        with path.open("r", encoding="utf-8-sig", newline="") as handle:
-            reader = csv.DictReader(handle)
-            headers = reader.fieldnames or []
-            missing_headers = [header for header in _ANSWER_HEADERS if header not in headers]
+        handle = path.open("r", buffering=_CSV_BUFFER_SIZE, encoding="utf-8-sig", newline="")
+    except FileNotFoundError:
+        return ["Selected CSV file does not exist."]
+
+    try:
+        with handle:
+            reader = csv.reader(handle)
+            # Column positions are resolved once; the last duplicate header wins, as with DictReader.
+            columns = {name: index for index, name in enumerate(next(reader, []))}
+            missing_headers = [header for header in _ANSWER_HEADERS if header not in columns]
             if missing_headers:
                 return [f"Missing header '{name}'." for name in missing_headers]
+            question_index, answer_index, points_index = (columns[header] for header in _ANSWER_HEADERS)
+            width = max(question_index, answer_index, points_index) + 1
 
-            for row_number, row in enumerate(reader, start=2):
+            row_number = 1
+            for row in reader:
                 if not row:
-                    errors.append(f"Row {row_number} is empty.")
-                    continue
+                    continue  # blank lines are skipped and not counted
+                row_number += 1
+                if len(row) < width:
+                    row += [""] * (width - len(row))
 
-                question = (row.get("Question") or "").strip()
-                answer = (row.get("Correct_Answer") or "").strip()
-                points_raw = (row.get("Points") or "").strip()
+                question = row[question_index].strip()
+                answer = row[answer_index].strip()
+                points_raw = row[points_index].strip()
 
                 if not question:
                     errors.append(f"Row {row_number}: Question cannot be empty.")
@@ -185,14 +301,10 @@ def validate_answer_key(csv_path: Path) -> list[str]:
 
                 if not answer:
                     errors.append(f"Row {row_number}: Correct_Answer cannot be empty.")
-                else:
-                    segments = answer.split(",")
-                    for segment in segments:
-                        if not _ANSWER_PATTERN.fullmatch(segment):
-                            errors.append(
-                                f"Row {row_number}: Correct_Answer '{answer}' must use letters a-e with commas and no spaces."
-                            )
-                            break
+                elif not _ANSWER_PATTERN.fullmatch(answer):
+                    errors.append(
+                        f"Row {row_number}: Correct_Answer '{answer}' must use letters a-e with commas and no spaces."
+                    )
 
                 if not points_raw:
                     errors.append(f"Row {row_number}: Points cannot be empty.")
@@ -210,10 +322,23 @@ def validate_answer_key(csv_path: Path) -> list[str]:
     return errors
 
 
+def _folder_has_file_ending(folder: Path, suffix: str) -> bool:
+    """Return True as soon as any file below ``folder`` ends with the lowercase ``suffix``.
+
+    The match ignores case, so ``scan.PDF`` counts like ``scan.pdf``, and no Path objects
+    are built for the entries.
+    """
+
+    for _dirpath, _dirnames, filenames in os.walk(folder):
+        if any(name.lower().endswith(suffix) for name in filenames):
+            return True
+    return False
+
+
 def validate_pdf_input(source: Path) -> list[str]:
     """Ensure the selected PDF/ZIP/folder contains at least one PDF."""
 
-    path = Path(source).expanduser()
+    path = _user_path(source)
     if not path.exists():
         return ["Selected path does not exist."]
 
@@ -222,38 +347,55 @@ def validate_pdf_input(source: Path) -> list[str]:
         if suffix == ".pdf":
             return []
         if suffix == ".zip":
-            with zipfile.ZipFile(path) as archive:
-                if any(
-                    not info.is_dir() and info.filename.lower().endswith(tuple(_PDF_EXTENSIONS))
-                    for info in archive.infolist()
-                ):
-                    return []
+            # Names ending in "/" are directory entries.
+            if any(not name.endswith("/") and name.lower().endswith(".pdf") for name in _zip_names(path)):
+                return []
             return ["ZIP archive does not contain any PDF files."]
         return ["Selected file must be a .pdf or .zip archive."]
 
     if path.is_dir():
-        if any(pdf.suffix.lower() in _PDF_EXTENSIONS for pdf in path.rglob("*.pdf")):
+        if _folder_has_file_ending(path, ".pdf"):
             return []
         return ["Folder does not contain any PDF files."]
 
     return ["Selected path must be a file or folder."]
 
 
+_poppler_found = False
+
+
 def poppler_available() -> bool:
-    """Return True if pdftoppm (Poppler) is available on PATH."""
+    """Return True if pdftoppm (Poppler) is available on PATH.
+
+    A positive result is remembered for the session; a miss is probed again on the next
+    call so installing Poppler while the GUI is open is picked up.
+    """
+
+    global _poppler_found
+    if _poppler_found:
+        return True
+
+    import shutil
+    import subprocess
 
     if shutil.which("pdftoppm"):
+        _poppler_found = True
         return True
+    # Fallback for when which() misses it; the probe runs only on a miss and is bounded.
     try:
         subprocess.run(
             ["pdftoppm", "-h"],
             check=False,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            timeout=2,
         )
-        return True
     except FileNotFoundError:
         return False
+    except subprocess.TimeoutExpired:
+        pass  # it started, so it is installed
+    _poppler_found = True
+    return True
 
 
 def layout_json_path(active_folder: Path | None, exam_title: str | None) -> Path | None:
@@ -270,26 +412,24 @@ def validate_scanner_inputs(source: Path, layout_path: Path) -> tuple[bool, str
     if not layout_path.exists():
         return False, f"Layout JSON not found: {layout_path}"
 
-    path = Path(source).expanduser()
-    if not path.exists():
+    path = _user_path(source)
+    try:
+        mode = path.stat().st_mode  # one stat answers exists/is_file/is_dir
+    except OSError:
         return False, f"Selected path does not exist: {path}"
 
-    if path.is_file():
+    if stat.S_ISREG(mode):
         suffix = path.suffix.lower()
         if suffix == ".zip":
-            with zipfile.ZipFile(path) as archive:
-                for info in archive.infolist():
-                    if info.is_dir():
-                        continue
-                    if info.filename.lower().endswith(".png"):
-                        return True, None
+            if any(not name.endswith("/") and name.lower().endswith(".png") for name in _zip_names(path)):
+                return True, None
             return False, "ZIP archive does not contain any PNG files."
         if suffix in _PNG_EXTENSIONS:
             return True, None
         return False, "Selected file must be a .png image or .zip archive."
 
-    if path.is_dir():
-        if any(file.suffix.lower() in _PNG_EXTENSIONS for file in path.rglob("*.png")):
+    if stat.S_ISDIR(mode):
+        if _folder_has_file_ending(path, ".png"):
             return True, None
         return False, "Folder does not contain any PNG files."
 
@@ -297,6 +437,8 @@ def validate_scanner_inputs(source: Path, layout_path: Path) -> tuple[bool, str
 
 
 def grade_inputs_active(active_folder: Path | None, exam_title: str | None) -> tuple[bool, str | None, Path | None, Path | None]:
+    """Check for required inputs (results.csv, answer_key.csv) and return their paths."""
+
     if not active_folder or not exam_title:
         return False, "No test selected.", None, None
 
@@ -318,11 +460,10 @@ def adjustment_inputs_active(
     if not ok:
         return False, error, None, None, None
 
-    miss_report_path: Path | None = None
-    if active_folder:
-        candidate = active_folder / "miss_analysis" / "miss_report.csv"
-        if candidate.exists():
-            miss_report_path = candidate
+    # grade_inputs_active only succeeds with an active folder, so it is set here.
+    assert active_folder
+    candidate = active_folder / "miss_analysis" / "miss_report.csv"
+    miss_report_path = candidate if candidate.exists() else None
     return True, None, results_path, key_path, miss_report_path
 
 
@@ -330,17 +471,20 @@ def parse_miss_report(miss_report_path: Path | None) -> list[dict[str, str]]:
     if not miss_report_path or not miss_report_path.exists():
         return []
     rows: list[dict[str, str]] = []
-    with miss_report_path.open("r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
-        if not reader.fieldnames:
+    with miss_report_path.open("r", buffering=_CSV_BUFFER_SIZE, encoding="utf-8-sig", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if not header:
             return []
+        # Resolve column positions once; -1 marks a missing column, read as "".
+        columns = {name: index for index, name in enumerate(header)}
+        indexes = [columns.get(name, -1) for name in _MISS_REPORT_FIELDS]
         for line in reader:
             if not line:
                 continue
-            question = (line.get("Question") or "").strip()
-            percent = (line.get("Percent_Missed") or "").strip()
-            missed = (line.get("Missed_Count") or "").strip()
-            total = (line.get("Total_Students") or "").strip()
+            question, percent, missed, total = (
+                line[index].strip() if 0 <= index < len(line) else "" for index in indexes
+            )
             if not question:
                 continue
             rows.append(
@@ -358,40 +502,41 @@ def list_adjustment_versions(active_folder: Path | None) -> list[str]:
     if not active_folder:
         return []
     adjustments_dir = active_folder / "adjustments"
-    if not adjustments_dir.exists():
+    try:
+        # Adding, removing or renaming a file bumps the directory mtime, so it keys the cache.
+        mtime_ns = adjustments_dir.stat().st_mtime_ns
+    except OSError:
         return []
+    return list(_adjustment_versions(os.fspath(adjustments_dir), mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _adjustment_versions(adjustments_dir: str, _mtime_ns: int) -> tuple[str, ...]:
     versions = set()
-    for csv_file in adjustments_dir.glob("*_results.csv"):
+    for csv_file in Path(adjustments_dir).glob("*_results.csv"):
         stem = csv_file.stem
         if stem.endswith("_results"):
             versions.add(stem[: -len("_results")])
-    return sorted(versions)
+    return tuple(sorted(versions))
 
 
 def next_adjustment_version(active_folder: Path | None) -> str:
-    prefix = "adjustment"
     existing = list_adjustment_versions(active_folder)
-    if not existing:
-        return f"{prefix}_1"
-    max_index = 0
-    for version in existing:
-        if version.startswith(f"{prefix}_"):
-            try:
-                value = int(version.split("_")[-1])
-            except ValueError:
-                continue
-            max_index = max(max_index, value)
-    return f"{prefix}_{max_index + 1}"
+    max_index = max(
+        (int(match.group(1)) for version in existing if (match := _ADJUSTMENT_NUMBER_PATTERN.fullmatch(version))),
+        default=0,
+    )
+    return f"adjustment_{max_index + 1}"
 
 
 def normalize_question_id(raw: str) -> str:
-    text = raw.strip()
+    text = raw.strip().upper()
     if not text:
         return ""
-    if not text.upper().startswith("Q"):
-        return f"Q{text.upper()}"
-    suffix = text[1:].strip()
-    return f"Q{suffix.upper()}" if suffix else "Q"
+    if not text.startswith("Q"):
+        return f"Q{text}"
+    suffix = text[1:].lstrip()
+    return f"Q{suffix}" if suffix else "Q"
 
 
 def is_valid_version_label(value: str) -> bool:
@@ -401,22 +546,6 @@ def is_valid_version_label(value: str) -> bool:
     return bool(_VERSION_PATTERN.fullmatch(text))
 
 
-def grade_inputs_active(active_folder: Path | None, exam_title: str | None) -> tuple[bool, str | None, Path | None, Path | None]:
-    """Check for required inputs (results.csv, answer_key.csv) and return their paths."""
-
-    if not active_folder or not exam_title:
-        return False, "No test selected.", None, None
-
-    results_path = active_folder / "results" / "results.csv"
-    key_path = active_folder / "tests" / f"{exam_title}_answer_key.csv"
-
-    if not results_path.exists():
-        return False, f"Missing results CSV at {results_path}. Run the Bubble Sheet Scanner tab first.", None, None
-    if not key_path.exists():
-        return False, f"Missing answer key CSV at {key_path}. Generate or import an answer key first.", None, None
-    return True, None, results_path, key_path
-
-
 __all__ = [
     "ACTIVE_TEST_NAME",
     "CLI_PATH",
@@ -432,6 +561,7 @@ __all__ = [
     "validate_pdf_input",
     "validate_scanner_inputs",
     "grade_inputs_active",
+    "invalidate_cli_cache",
     "adjustment_inputs_active",
     "layout_json_path",
     "parse_miss_report",
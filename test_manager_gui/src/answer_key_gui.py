@@ -54,6 +54,7 @@ class AnswerKeyGui(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._last_csv: Path | None = None
+        self._mkdir_done: set[Path] = set()
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -167,10 +168,11 @@ class AnswerKeyGui(QWidget):
             )
             return
 
-        csv_path = Path(self.csv_input.text().strip()).expanduser()
-        if not csv_path:
+        csv_text = self.csv_input.text().strip()
+        if not csv_text:
             QMessageBox.warning(self, "Missing file", "Choose a CSV file to import.")
             return
+        csv_path = Path(csv_text).expanduser()
         if not csv_path.exists():
             QMessageBox.warning(self, "Missing file", f"File '{csv_path}' does not exist.")
             return
@@ -195,7 +197,9 @@ class AnswerKeyGui(QWidget):
 
         expected_name = f"{exam_title}_answer_key.csv"
         tests_dir = active_folder / "tests"
-        tests_dir.mkdir(parents=True, exist_ok=True)
+        if tests_dir not in self._mkdir_done:
+            tests_dir.mkdir(parents=True, exist_ok=True)
+            self._mkdir_done.add(tests_dir)
         destination = tests_dir / expected_name
 
         try:
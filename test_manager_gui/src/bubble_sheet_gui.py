@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import shlex
+import os
 import subprocess
 import sys
 from pathlib import Path
 from typing import TypedDict
 
 import config
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QProcess, QProcessEnvironment, Qt
 from PyQt6.QtGui import QIntValidator, QFont, QShowEvent
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -23,26 +23,74 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+# (label, attribute, default, minimum, maximum, tooltip)
+_INT_FIELDS = (
+    ("Questions:", "questions_input", "25", 1, 50, "Number of questions (1–50)."),
+    ("ID Length:", "id_length_input", "7", 4, 10, "Student ID length (4–10)."),
+)
+# (label, attribute, ((item text, CLI value), ...), tooltip)
+_CHOICE_FIELDS = (
+    (
+        "ID Orientation:",
+        "orientation_select",
+        (("Vertical", "vertical"), ("Horizontal", "horizontal")),
+        "Arrange ID digits vertically or horizontally.",
+    ),
+    ("Paper Size:", "paper_size_select", (("A4", "A4"), ("LETTER", "LETTER")), "Paper size for the bubble sheet."),
+)
+
+
+def _parse_int(text: str, low: int, high: int, label: str) -> int:
+    try:
+        value = int(text)
+    except ValueError as exc:  # noqa: PERF203
+        raise ValueError(f"{label} must be a number between {low} and {high}.") from exc
+    if not (low <= value <= high):
+        raise ValueError(f"{label} must be between {low} and {high}.")
+    return value
+
 
 class _FormValues(TypedDict):
     questions: int
     id_length: int
     orientation: str
     paper_size: str
-    output_dir: Path
+    # Paths are kept as strings: they only feed the CLI arguments and the summary.
+    output_dir: str
     output_name: str
-    pdf_path: Path
-    json_path: Path
+    pdf_path: str
+    json_path: str
 
 
 class BubbleSheetGui(QWidget):
     """Tab that wraps bubblexan_cli/generate_bubblesheet.py."""
 
+    questions_input: QLineEdit
+    id_length_input: QLineEdit
+    orientation_select: QComboBox
+    paper_size_select: QComboBox
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         config.validate_cli_environment(["generate_bubblesheet.py"])
-        self._script_path = config.CLI_PATH / "generate_bubblesheet.py"
+        self._script_path = os.path.join(config.CLI_PATH, "generate_bubblesheet.py")
         self._last_pdf_path: Path | None = None
+        # (ACTIVE_TEST_NAME, expected bubble sheet PDF) for the last refresh.
+        self._cached_active: tuple[str | None, Path | None] | None = None
+        self._mkdir_done: set[str] = set()
+        # State for the generator run in flight; output is streamed line by line.
+        self._pending_params: _FormValues | None = None
+        self._had_previous_pdf = False
+        self._stdout_buffer = b""
+        self._process = QProcess(self)
+        self._process.setWorkingDirectory(str(config.CLI_PATH))
+        self._process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        environment = QProcessEnvironment.systemEnvironment()
+        environment.insert("PYTHONUNBUFFERED", "1")
+        self._process.setProcessEnvironment(environment)
+        self._process.readyReadStandardOutput.connect(self._read_stdout)
+        self._process.errorOccurred.connect(self._handle_process_error)
+        self._process.finished.connect(self._handle_process_finished)
         self._init_ui()
         self._refresh_existing_output()
 
@@ -59,25 +107,20 @@ class BubbleSheetGui(QWidget):
         form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
         form_layout.setFormAlignment(Qt.AlignmentFlag.AlignTop)
 
-        self.questions_input = QLineEdit("25")
-        self.questions_input.setValidator(QIntValidator(1, 50, self))
-        self.questions_input.setToolTip("Number of questions (1–50).")
-        form_layout.addRow("Questions:", self.questions_input)
-
-        self.id_length_input = QLineEdit("7")
-        self.id_length_input.setValidator(QIntValidator(4, 10, self))
-        self.id_length_input.setToolTip("Student ID length (4–10).")
-        form_layout.addRow("ID Length:", self.id_length_input)
-
-        self.orientation_select = QComboBox()
-        self.orientation_select.addItems(["Vertical", "Horizontal"])
-        self.orientation_select.setToolTip("Arrange ID digits vertically or horizontally.")
-        form_layout.addRow("ID Orientation:", self.orientation_select)
-
-        self.paper_size_select = QComboBox()
-        self.paper_size_select.addItems(["A4", "LETTER"])
-        self.paper_size_select.setToolTip("Paper size for the bubble sheet.")
-        form_layout.addRow("Paper Size:", self.paper_size_select)
+        for label, attr, default, low, high, tooltip in _INT_FIELDS:
+            line_edit = QLineEdit(default)
+            line_edit.setValidator(QIntValidator(low, high, self))
+            line_edit.setToolTip(tooltip)
+            setattr(self, attr, line_edit)
+            form_layout.addRow(label, line_edit)
+
+        for label, attr, items, tooltip in _CHOICE_FIELDS:
+            combo = QComboBox()
+            for text, value in items:
+                combo.addItem(text, value)
+            combo.setToolTip(tooltip)
+            setattr(self, attr, combo)
+            form_layout.addRow(label, combo)
 
         content_layout.addLayout(form_layout)
 
@@ -163,31 +206,25 @@ class BubbleSheetGui(QWidget):
         if not title:
             raise ValueError("Could not determine the exam title from the selected test.")
 
-        def _parse_int(widget: QLineEdit, low: int, high: int, label: str) -> int:
-            try:
-                value = int(widget.text())
-            except ValueError as exc:  # noqa: PERF203
-                raise ValueError(f"{label} must be a number between {low} and {high}.") from exc
-            if not (low <= value <= high):
-                raise ValueError(f"{label} must be between {low} and {high}.")
-            return value
+        questions = _parse_int(self.questions_input.text(), 1, 50, "Questions")
+        id_length = _parse_int(self.id_length_input.text(), 4, 10, "ID Length")
 
-        questions = _parse_int(self.questions_input, 1, 50, "Questions")
-        id_length = _parse_int(self.id_length_input, 4, 10, "ID Length")
-
-        orientation = self.orientation_select.currentText().strip().lower()
+        # Combo items carry the CLI spelling as item data, so no case folding is needed.
+        orientation = self.orientation_select.currentData()
         if orientation not in {"vertical", "horizontal"}:
             raise ValueError("Orientation must be vertical or horizontal.")
 
-        paper_size = self.paper_size_select.currentText().strip().upper()
+        paper_size = self.paper_size_select.currentData()
         if paper_size not in {"A4", "LETTER"}:
             raise ValueError("Paper size must be A4 or LETTER.")
 
-        output_dir = active_folder / "bubble_sheets"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = os.path.join(active_folder, "bubble_sheets")
+        if output_dir not in self._mkdir_done:
+            os.makedirs(output_dir, exist_ok=True)
+            self._mkdir_done.add(output_dir)
 
-        pdf_path = output_dir / f"{title}.pdf"
-        json_path = output_dir / f"{title}_layout.json"
+        pdf_path = os.path.join(output_dir, f"{title}.pdf")
+        json_path = os.path.join(output_dir, f"{title}_layout.json")
 
         return {
             "questions": questions,
@@ -201,6 +238,8 @@ class BubbleSheetGui(QWidget):
         }
 
     def _run_generator(self) -> None:
+        if self._process.state() != QProcess.ProcessState.NotRunning:
+            return
         try:
             params = self._collect_inputs()
         except ValueError as exc:
@@ -211,53 +250,62 @@ class BubbleSheetGui(QWidget):
         self.generate_button.setEnabled(False)
         self.review_button.setEnabled(False)
         self.output_view.clear()
-        self.output_view.append(f"$ {shlex.join(command)}\n")
-
-        had_previous_pdf = self._last_pdf_path and self._last_pdf_path.exists()
-        success = False
-        try:
-            result = subprocess.run(
-                command,
-                check=True,
-                capture_output=True,
-                text=True,
-                cwd=str(config.CLI_PATH),
-            )
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
-                "Missing executable",
-                "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
-            )
+        # Display only: the arguments never pass through a shell, so just mark paths with spaces.
+        shown = " ".join(f'"{arg}"' if " " in arg else arg for arg in command)
+        self.output_view.append(f"$ {shown}\n")
+
+        # _last_pdf_path is only set once the PDF is known to exist; _review_pdf re-checks on click.
+        self._had_previous_pdf = self._last_pdf_path is not None
+        self._pending_params = params
+        self._stdout_buffer = b""
+        self._process.start(command[0], command[1:])
+
+    def _read_stdout(self) -> None:
+        data = bytes(self._process.readAllStandardOutput())
+        *lines, self._stdout_buffer = (self._stdout_buffer + data).split(b"\n")
+        if lines:
+            self.output_view.append(b"\n".join(lines).decode(errors="replace").rstrip())
+
+    def _handle_process_error(self, error: QProcess.ProcessError) -> None:
+        if error != QProcess.ProcessError.FailedToStart:
             return
-        except subprocess.CalledProcessError as exc:
-            if exc.stdout:
-                self.output_view.append(exc.stdout)
-            if exc.stderr:
-                self.output_view.append(exc.stderr)
+        QMessageBox.critical(
+            self,
+            "Missing executable",
+            "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
+        )
+        self._finish_generator(success=False)
+
+    def _handle_process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        self._read_stdout()
+        tail = self._stdout_buffer.decode(errors="replace").rstrip()
+        if tail:
+            self.output_view.append(tail)
+        self._stdout_buffer = b""
+        success = exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0
+        if not success:
             QMessageBox.critical(
                 self,
                 "Generator failed",
                 "The CLI command reported an error. See the output panel for details.",
             )
-        else:
-            for chunk in (result.stdout.strip(), result.stderr.strip()):
-                if chunk:
-                    self.output_view.append(chunk + "\n")
-            summary = self._format_summary(params)
-            self.output_view.append(summary)
-            self._last_pdf_path = params["pdf_path"]
+        self._finish_generator(success)
+
+    def _finish_generator(self, success: bool) -> None:
+        params = self._pending_params
+        self._pending_params = None
+        if success and params is not None:
+            self.output_view.append("\n" + self._format_summary(params))
+            self._last_pdf_path = Path(params["pdf_path"])
+            self.review_button.setEnabled(True)
+        elif self._had_previous_pdf:
             self.review_button.setEnabled(True)
-            success = True
-        finally:
-            self.generate_button.setEnabled(True)
-            if not success and had_previous_pdf:
-                self.review_button.setEnabled(True)
+        self.generate_button.setEnabled(True)
 
     def _build_command(self, params: _FormValues) -> list[str]:
         cmd = [
-            str(config.PYTHON_EXECUTABLE),
-            str(self._script_path),
+            os.fspath(config.PYTHON_EXECUTABLE),
+            self._script_path,
             "--questions",
             str(params["questions"]),
             "--id-length",
@@ -269,35 +317,39 @@ class BubbleSheetGui(QWidget):
             "--paper-size",
             params["paper_size"],
             "--output-dir",
-            str(params["output_dir"]),
+            params["output_dir"],
         ]
         return cmd
 
     def _format_summary(self, params: _FormValues) -> str:
         lines = [
             "Generated files:",
-            str(params["pdf_path"]),
-            str(params["json_path"]),
+            params["pdf_path"],
+            params["json_path"],
         ]
         return "\n".join(lines)
 
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
-        self._refresh_existing_output()
+        if self._process.state() == QProcess.ProcessState.NotRunning:
+            self._refresh_existing_output()
 
     def _refresh_existing_output(self) -> None:
         """Check if a bubble sheet already exists for the selected test."""
 
         active_name = config.ACTIVE_TEST_NAME
-        active_folder = config.active_test_folder()
-        title = config.extract_exam_title()
-
-        if not active_folder or not title:
+        if self._cached_active is None or self._cached_active[0] != active_name:
+            active_folder = config.active_test_folder()
+            title = config.extract_exam_title()
+            pdf_path = active_folder / "bubble_sheets" / f"{title}.pdf" if active_folder and title else None
+            self._cached_active = (active_name, pdf_path)
+
+        candidate = self._cached_active[1]
+        if candidate is None:
             self._last_pdf_path = None
             self.review_button.setEnabled(False)
             return
 
-        candidate = active_folder / "bubble_sheets" / f"{title}.pdf"
         if candidate.exists():
             self._last_pdf_path = candidate
             self.review_button.setEnabled(True)
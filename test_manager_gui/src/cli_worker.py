@@ -0,0 +1,112 @@
+"""Persistent CLI worker process shared by tabs that run the same script repeatedly."""
+
+from __future__ import annotations
+
+import json
+
+import config
+from PyQt6.QtCore import QCoreApplication, QObject, QProcess, QProcessEnvironment, pyqtSignal
+
+_WORKER_SCRIPT = config.CLI_PATH / "worker.py"
+_RESULT_PREFIX = b"@@bubblexan-worker "
+
+
+class CliWorker(QObject):
+    """Keep one ``bubblexan_cli/worker.py`` process alive and run jobs through it.
+
+    The worker imports its CLI module once, so repeated runs skip interpreter
+    start-up and heavy imports. ``output`` carries each batch of complete output
+    lines as soon as it arrives, ``finished`` the job's exit code, and
+    ``start_failed`` fires when the interpreter cannot be launched for a job.
+    """
+
+    output = pyqtSignal(str)
+    finished = pyqtSignal(int)
+    start_failed = pyqtSignal()
+
+    def __init__(self, module: str, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._module = module
+        self._busy = False
+        self._stdout_buffer = b""
+        self._process = QProcess(self)
+        self._process.setWorkingDirectory(str(config.CLI_PATH))
+        environment = QProcessEnvironment.systemEnvironment()
+        environment.insert("PYTHONUNBUFFERED", "1")
+        self._process.setProcessEnvironment(environment)
+        self._process.readyReadStandardOutput.connect(self._read_stdout)
+        self._process.readyReadStandardError.connect(self._read_stderr)
+        self._process.errorOccurred.connect(self._handle_process_error)
+        self._process.finished.connect(self._handle_process_finished)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+        self._start()
+
+    def is_busy(self) -> bool:
+        return self._busy
+
+    def run(self, argv: list[str]) -> None:
+        """Queue one job; ``finished`` is emitted when it completes."""
+
+        if self._process.state() == QProcess.ProcessState.NotRunning:
+            self._start()
+        self._busy = True
+        self._process.write(json.dumps({"argv": argv}).encode() + b"\n")
+
+    def shutdown(self) -> None:
+        if self._process.state() == QProcess.ProcessState.NotRunning:
+            return
+        self._process.closeWriteChannel()
+        if not self._process.waitForFinished(1000):
+            self._process.kill()
+            self._process.waitForFinished(1000)
+
+    def _start(self) -> None:
+        self._stdout_buffer = b""
+        self._process.start(str(config.PYTHON_EXECUTABLE), [str(_WORKER_SCRIPT), self._module])
+
+    def _read_stdout(self) -> None:
+        self._stdout_buffer += bytes(self._process.readAllStandardOutput())
+        *lines, self._stdout_buffer = self._stdout_buffer.split(b"\n")
+        text_lines: list[str] = []
+        for line in lines:
+            text, marker, result = line.partition(_RESULT_PREFIX)
+            if not marker:
+                text_lines.append(line.decode(errors="replace").rstrip())
+                continue
+            if text.strip():
+                # Output that did not end with a newline shares the result line.
+                text_lines.append(text.decode(errors="replace").rstrip())
+            if text_lines:
+                self.output.emit("\n".join(text_lines))
+                text_lines = []
+            self._read_stderr()
+            try:
+                exit_code = int(json.loads(result)["exit_code"])
+            except (ValueError, KeyError, TypeError):
+                exit_code = 1
+            self._busy = False
+            self.finished.emit(exit_code)
+        if text_lines:
+            self.output.emit("\n".join(text_lines))
+
+    def _read_stderr(self) -> None:
+        text = bytes(self._process.readAllStandardError()).decode(errors="replace").strip()
+        if text:
+            self.output.emit(text)
+
+    def _handle_process_error(self, error: QProcess.ProcessError) -> None:
+        if error != QProcess.ProcessError.FailedToStart or not self._busy:
+            return
+        self._busy = False
+        self.start_failed.emit()
+
+    def _handle_process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        # The worker only exits on its own if it crashed; the next run() restarts it.
+        self._read_stdout()
+        self._read_stderr()
+        if self._busy:
+            self._busy = False
+            crashed = exit_status != QProcess.ExitStatus.NormalExit or exit_code == 0
+            self.finished.emit(1 if crashed else exit_code)
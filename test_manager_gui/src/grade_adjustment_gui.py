@@ -3,23 +3,25 @@
 from __future__ import annotations
 
 import csv
-import subprocess
-import sys
+import os
+import re
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from shlex import quote as shlex_quote
 
 import config
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QShowEvent
+from cli_worker import CliWorker
+from output_log import OutputLog, display_command, open_path
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QBrush, QFont, QShowEvent
 from PyQt6.QtWidgets import (
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -48,13 +50,104 @@ Scoring math during re-grading:
 - Given-back questions award all students the full point value automatically.
 """
 
+_MISS_COLUMNS = ("Question", "% Missed", "Missed / Total")
+_HIGH_MISS_BRUSH = QBrush(Qt.GlobalColor.yellow)
+# analyze_misses.py writes plain decimals ("62.50"); anything else is treated as 0%.
+_PERCENT_PATTERN = re.compile(r"[0-9]+(?:\.[0-9]*)?|\.[0-9]+", re.ASCII)
+
+
+def _adjustment_file_names(adjustments_dir: Path) -> frozenset[str]:
+    try:
+        mtime_ns = adjustments_dir.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _scan_file_names(os.fspath(adjustments_dir), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _scan_file_names(directory: str, _mtime_ns: int) -> frozenset[str]:
+    # Keyed by the directory mtime so repeated combo signals skip the scandir.
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _parse_question_ids(text: str) -> dict[str, None]:
+    # A dict dedupes while keeping the typed order; its keys() still support set operations.
+    questions = dict.fromkeys(map(config.normalize_question_id, text.split(",")))
+    questions.pop("", None)
+    return questions
+
+
+class _VersionScanWorker(QThread):
+    """List saved adjustment versions off the GUI thread so switching to the tab never waits on adjustments/."""
+
+    done = pyqtSignal(list)
+
+    def __init__(self, active_folder: Path | None, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._active_folder = active_folder
+
+    def run(self) -> None:
+        self.done.emit(config.list_adjustment_versions(self._active_folder))
+
+
+class _MissReportModel(QAbstractTableModel):
+    """Read-only view of parsed miss_report.csv rows; rows missed by 50% or more are highlighted."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._cells: list[tuple[str, str, str]] = []
+        self._question_ids: list[str] = []
+        self._highlighted: list[bool] = []
+
+    def set_rows(self, rows: list[dict[str, str]]) -> None:
+        self.beginResetModel()
+        self._cells = []
+        self._question_ids = []
+        self._highlighted = []
+        for row in rows:
+            percent = row.get("Percent_Missed", "")
+            detail = f"{row.get('Missed_Count','')} / {row.get('Total_Students','')}"
+            self._cells.append((row["Question"], percent, detail.strip()))
+            self._question_ids.append(config.normalize_question_id(row["Question"]))
+            self._highlighted.append(bool(_PERCENT_PATTERN.fullmatch(percent)) and float(percent) >= 50.0)
+        self.endResetModel()
+
+    def question_id(self, row: int) -> str:
+        """Normalized ID for ``row``, or "" when the report's label does not normalize."""
+
+        return self._question_ids[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cells)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_MISS_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._cells[index.row()][index.column()]
+        if role == Qt.ItemDataRole.BackgroundRole and self._highlighted[index.row()]:
+            return _HIGH_MISS_BRUSH
+        return None
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> object:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _MISS_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
 
 class GradeAdjustmentGui(QWidget):
     """Tab that wraps give_back_questions.py with version management."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        config.validate_cli_environment(["give_back_questions.py", "grade.py"])
+        config.validate_cli_environment(["give_back_questions.py", "grade.py", "worker.py"])
         self._script_path = config.CLI_PATH / "give_back_questions.py"
         self._results_path: Path | None = None
         self._answer_key_path: Path | None = None
@@ -64,7 +157,19 @@ class GradeAdjustmentGui(QWidget):
         self._inputs_valid = False
         self._last_selection_tokens: set[str] = set()
         self._suspend_selection_sync = False
+        self._review_timer = QTimer(self)
+        self._review_timer.setSingleShot(True)
+        self._review_timer.setInterval(50)
+        self._review_timer.timeout.connect(self._update_review_buttons)
+        self._pending_version: str | None = None
+        self._preview_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._version_scan: _VersionScanWorker | None = None
         self._init_ui()
+        # give_back_questions.py runs in a long-lived CLI worker so each click skips interpreter and pandas start-up.
+        self._worker = CliWorker("give_back_questions", self)
+        self._worker.output.connect(self._output_log.append)
+        self._worker.start_failed.connect(self._handle_start_failed)
+        self._worker.finished.connect(lambda exit_code: self._command_finished(success=exit_code == 0))
         self._evaluate_inputs(show_message=True)
         self._refresh_versions()
 
@@ -76,11 +181,14 @@ class GradeAdjustmentGui(QWidget):
         questions_label.setContentsMargins(0, 10, 0, 0)
         main_layout.addWidget(questions_label, alignment=Qt.AlignmentFlag.AlignLeft)
 
-        self.question_table = QTableWidget(0, 3, self)
-        self.question_table.setHorizontalHeaderLabels(["Question", "% Missed", "Missed / Total"])
-        self.question_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.question_table.setSelectionMode(QTableWidget.SelectionMode.MultiSelection)
-        self.question_table.horizontalHeader().setStretchLastSection(True)
+        self._miss_model = _MissReportModel(self)
+        self.question_table = QTableView(self)
+        self.question_table.setModel(self._miss_model)
+        self.question_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.question_table.setSelectionMode(QTableView.SelectionMode.MultiSelection)
+        header = self.question_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setStretchLastSection(True)
         self.question_table.setMinimumHeight(200)
         self.question_table.setMaximumHeight(240)
         self.question_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.MinimumExpanding)
@@ -120,7 +228,7 @@ class GradeAdjustmentGui(QWidget):
         version_layout.addWidget(version_group)
         version_layout.addStretch()
         main_layout.addWidget(version_row)
-        self.question_table.itemSelectionChanged.connect(self._sync_manual_selection)
+        self.question_table.selectionModel().selectionChanged.connect(self._sync_manual_selection)
 
         existing_row = QWidget()
         existing_layout = QHBoxLayout(existing_row)
@@ -129,7 +237,7 @@ class GradeAdjustmentGui(QWidget):
         existing_layout.addWidget(QLabel("Saved adjustments:"))
         self.version_combo = QComboBox()
         self.version_combo.setMinimumContentsLength(20)
-        self.version_combo.currentTextChanged.connect(lambda _: self._update_review_buttons())
+        self.version_combo.currentTextChanged.connect(lambda _: self._review_timer.start())
         existing_layout.addWidget(self.version_combo)
         existing_layout.addStretch()
         main_layout.addWidget(existing_row)
@@ -213,8 +321,10 @@ class GradeAdjustmentGui(QWidget):
         mono = QFont("Courier New", 11)
         self.output_view.setFont(mono)
         self.output_view.setReadOnly(True)
+        self.output_view.document().setMaximumBlockCount(5000)
         self.output_view.setMinimumHeight(220)
         main_layout.addWidget(self.output_view)
+        self._output_log = OutputLog(self.output_view)
 
         self._update_review_buttons()
         self._update_final_grade_controls()
@@ -247,7 +357,6 @@ class GradeAdjustmentGui(QWidget):
         self.finalize_button.setEnabled(True)
         self._inputs_valid = True
         self._load_miss_report()
-        self._update_version_placeholder()
         self._update_final_grade_controls()
         return True
 
@@ -255,33 +364,13 @@ class GradeAdjustmentGui(QWidget):
         self._suspend_selection_sync = True
         rows = config.parse_miss_report(self._miss_report_path)
         self._available_questions = rows
-        self.question_table.setRowCount(0)
+        self._miss_model.set_rows(rows)
         if not rows:
-            self.output_view.append("Miss report not found or empty. Select questions manually.")
+            self._output_log.append("Miss report not found or empty. Select questions manually.")
             self._suspend_selection_sync = False
             self._last_selection_tokens.clear()
             self.manual_input.clear()
             return
-        for row in rows:
-            current_row = self.question_table.rowCount()
-            self.question_table.insertRow(current_row)
-            percent = row.get("Percent_Missed", "")
-            try:
-                percent_value = float(percent)
-            except ValueError:
-                percent_value = 0.0
-            question_item = QTableWidgetItem(row["Question"])
-            percent_item = QTableWidgetItem(percent)
-            detail = f"{row.get('Missed_Count','')} / {row.get('Total_Students','')}"
-            detail_item = QTableWidgetItem(detail.strip())
-            if percent_value >= 50.0:
-                question_item.setBackground(Qt.GlobalColor.yellow)
-                percent_item.setBackground(Qt.GlobalColor.yellow)
-                detail_item.setBackground(Qt.GlobalColor.yellow)
-            self.question_table.setItem(current_row, 0, question_item)
-            self.question_table.setItem(current_row, 1, percent_item)
-            self.question_table.setItem(current_row, 2, detail_item)
-        self.question_table.resizeColumnsToContents()
         self.question_table.clearSelection()
         self._suspend_selection_sync = False
         self._last_selection_tokens.clear()
@@ -293,16 +382,10 @@ class GradeAdjustmentGui(QWidget):
         return self._evaluate_inputs(show_message=show_message)
 
     def _gather_question_ids(self) -> list[str]:
-        questions: set[str] = set()
-        manual_text = self.manual_input.text().strip()
-        if manual_text:
-            for token in manual_text.split(","):
-                normalized = config.normalize_question_id(token)
-                if normalized:
-                    questions.add(normalized)
+        questions = _parse_question_ids(self.manual_input.text())
         if not questions:
             raise ValueError("Select at least one question or enter IDs manually (e.g., Q1,Q3).")
-        return sorted(questions)
+        return list(questions)
 
     def _preview_adjustment(self) -> None:
         if not self._ensure_inputs_ready(show_message=False):
@@ -322,28 +405,12 @@ class GradeAdjustmentGui(QWidget):
             str(self._answer_key_path),
             "--give-back",
             ",".join(questions),
+            "--python",
+            str(config.PYTHON_EXECUTABLE),
         ]
-        with tempfile.TemporaryDirectory(prefix="preview_adjustment") as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            command.extend(["--version", "preview", "--output-dir", str(tmp_path)])
-            self.output_view.append(f"$ {' '.join(shlex_quote(part) for part in command)}\n")
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                cwd=str(config.CLI_PATH),
-            )
-            if result.returncode != 0:
-                self.output_view.append(result.stdout)
-                self.output_view.append(result.stderr)
-                QMessageBox.critical(
-                    self,
-                    "Preview failed",
-                    "The CLI command reported an error. See the output panel for details.",
-                )
-                return
-            preview_lines = result.stdout.strip() or "Preview completed."
-            self.output_view.append(preview_lines + "\n(Preview files stored in a temporary folder.)\n")
+        self._preview_dir = tempfile.TemporaryDirectory(prefix="preview_adjustment")
+        command.extend(["--version", "preview", "--output-dir", self._preview_dir.name])
+        self._start_command(command)
 
     def _save_adjustment(self) -> None:
         if not self._ensure_inputs_ready(show_message=False):
@@ -377,32 +444,55 @@ class GradeAdjustmentGui(QWidget):
             str(self._answer_key_path),
             "--give-back",
             ",".join(questions),
+            "--python",
+            str(config.PYTHON_EXECUTABLE),
             "--version",
             version,
             "--output-dir",
             str(adjustments_dir),
         ]
         command.extend(["--log", str(adjustments_dir / f"{version}.log")])
-        self.output_view.append(f"$ {' '.join(shlex_quote(part) for part in command)}\n")
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            cwd=str(config.CLI_PATH),
+        self._pending_version = version
+        self._start_command(command)
+
+    def _start_command(self, command: list[str]) -> None:
+        self.preview_button.setEnabled(False)
+        self.save_button.setEnabled(False)
+        self._output_log.append(f"$ {display_command(command)}\n")
+        self._worker.run(command[2:])
+
+    def _handle_start_failed(self) -> None:
+        self._output_log.flush()
+        QMessageBox.critical(
+            self,
+            "Missing executable",
+            "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
         )
-        if result.returncode != 0:
-            self.output_view.append(result.stdout)
-            self.output_view.append(result.stderr)
+        self._finish_command(success=False)
+
+    def _command_finished(self, success: bool) -> None:
+        self._output_log.flush()
+        if not success:
             QMessageBox.critical(
                 self,
-                "Adjustment failed",
+                "Adjustment failed" if self._pending_version else "Preview failed",
                 "The CLI command reported an error. See the output panel for details.",
             )
-            return
-        if result.stdout.strip():
-            self.output_view.append(result.stdout.strip())
-        self.output_view.append(f"Saved adjustment '{version}'.\n")
-        self._refresh_versions(select_version=version)
+        self._finish_command(success)
+
+    def _finish_command(self, success: bool) -> None:
+        version = self._pending_version
+        self._pending_version = None
+        if self._preview_dir is not None:
+            self._preview_dir.cleanup()
+            self._preview_dir = None
+            if success:
+                self._output_log.append("Preview completed.\n(Preview files stored in a temporary folder.)\n")
+        elif success and version:
+            self._output_log.append(f"Saved adjustment '{version}'.\n")
+            self._refresh_versions(select_version=version)
+        self.preview_button.setEnabled(self._inputs_valid)
+        self.save_button.setEnabled(self._inputs_valid)
 
     def _finalize_adjustment(self) -> None:
         version = self.version_combo.currentText().strip()
@@ -421,26 +511,58 @@ class GradeAdjustmentGui(QWidget):
         adjustments_dir = active_folder / "adjustments"
         grades_dir = active_folder / "grades"
         grades_dir.mkdir(parents=True, exist_ok=True)
-        src_csv = adjustments_dir / f"{version}_graded_report.csv"
-        src_xlsx = adjustments_dir / f"{version}_graded_report.xlsx"
-        if not src_csv.exists() or not src_xlsx.exists():
+        try:
+            os.replace(adjustments_dir / f"{version}_graded_report.csv", grades_dir / "graded_report.csv")
+        except FileNotFoundError:
             QMessageBox.warning(
                 self,
                 "Files missing",
-                f"Could not find {version}_graded_report.csv/.xlsx. Save the adjustment first.",
+                f"Could not find {version}_graded_report.csv. Save the adjustment first.",
             )
             return
-        dst_csv = grades_dir / "graded_report.csv"
+        # The CSV is the official grade record; the workbook is copied when present.
         dst_xlsx = grades_dir / "graded_report.xlsx"
-        src_csv.replace(dst_csv)
-        src_xlsx.replace(dst_xlsx)
-        self.output_view.append(f"Finalized grades from {version} into {grades_dir}.\n")
-        QMessageBox.information(self, "Grades finalized", f"{version} copied into grades/.")
-        self._update_final_grade_button()
+        try:
+            os.replace(adjustments_dir / f"{version}_graded_report.xlsx", dst_xlsx)
+        except FileNotFoundError:
+            # Never leave a workbook from an earlier version next to the new CSV.
+            dst_xlsx.unlink(missing_ok=True)
+            self._output_log.append(f"Finalized grades from {version} into {grades_dir} (CSV only).\n")
+            self._output_log.flush()
+            QMessageBox.warning(
+                self,
+                "Grades finalized without workbook",
+                f"{version}_graded_report.xlsx was not found, so only the CSV was copied into grades/. "
+                "The previous graded_report.xlsx was removed so it cannot be mistaken for the new grades.",
+            )
+        else:
+            self._output_log.append(f"Finalized grades from {version} into {grades_dir}.\n")
+            self._output_log.flush()
+            QMessageBox.information(self, "Grades finalized", f"{version} copied into grades/.")
+        self._update_review_buttons()
+        self._update_final_grade_controls()
 
     def _refresh_versions(self, select_version: str | None = None) -> None:
-        active_folder = config.active_test_folder()
-        self._versions = config.list_adjustment_versions(active_folder)
+        self._version_scan = None  # a scan still in flight is now stale
+        self._apply_versions(config.list_adjustment_versions(config.active_test_folder()), select_version)
+
+    def _refresh_versions_async(self) -> None:
+        worker = _VersionScanWorker(config.active_test_folder(), self)
+        worker.done.connect(lambda versions: self._handle_versions_scanned(worker, versions))
+        self._version_scan = worker
+        worker.start()
+
+    def _handle_versions_scanned(self, worker: _VersionScanWorker, versions: list[str]) -> None:
+        worker.wait()
+        worker.deleteLater()
+        # Only the latest scan reflects the current test folder and adjustments/ contents.
+        if worker is not self._version_scan:
+            return
+        self._version_scan = None
+        self._apply_versions(versions, self.version_combo.currentText().strip() or None)
+
+    def _apply_versions(self, versions: list[str], select_version: str | None) -> None:
+        self._versions = versions
         self.version_combo.blockSignals(True)
         self.version_combo.clear()
         self.version_combo.addItems(self._versions)
@@ -459,22 +581,23 @@ class GradeAdjustmentGui(QWidget):
             self.version_input.setPlaceholderText(suggestion)
 
     def _update_review_buttons(self) -> None:
+        self._review_timer.stop()
         version = self.version_combo.currentText().strip()
         active_folder = config.active_test_folder()
         if not version or not active_folder:
             self.review_adjusted_button.setEnabled(False)
             self.review_log_button.setEnabled(False)
             return
-        adjustments_dir = active_folder / "adjustments"
-        has_results = (adjustments_dir / f"{version}_results.csv").exists()
-        has_csv = (adjustments_dir / f"{version}_graded_report.csv").exists()
-        has_xlsx = (adjustments_dir / f"{version}_graded_report.xlsx").exists()
+        names = _adjustment_file_names(active_folder / "adjustments")
+        has_results = f"{version}_results.csv" in names
+        has_csv = f"{version}_graded_report.csv" in names
+        has_xlsx = f"{version}_graded_report.xlsx" in names
         any_adjusted = has_results or has_csv or has_xlsx
         self.review_adjusted_button.setEnabled(any_adjusted)
         self.review_results_action.setEnabled(has_results)
         self.review_grades_csv_action.setEnabled(has_csv)
         self.review_grades_xlsx_action.setEnabled(has_xlsx)
-        self.review_log_button.setEnabled((adjustments_dir / f"{version}.log").exists())
+        self.review_log_button.setEnabled(f"{version}.log" in names)
 
     def _open_version_file(self, suffix: str, label: str) -> None:
         version = self.version_combo.currentText().strip()
@@ -491,12 +614,7 @@ class GradeAdjustmentGui(QWidget):
 
     def _open_path(self, path: Path, label: str) -> None:
         try:
-            if sys.platform.startswith("win"):
-                subprocess.Popen(["cmd", "/c", "start", "", str(path)])
-            elif sys.platform == "darwin":
-                subprocess.Popen(["open", str(path)])
-            else:
-                subprocess.Popen(["xdg-open", str(path)])
+            open_path(path)
         except OSError as exc:  # noqa: PERF203
             QMessageBox.critical(self, "Viewer error", f"Could not open {label}: {exc}")
 
@@ -506,22 +624,9 @@ class GradeAdjustmentGui(QWidget):
         selection_model = self.question_table.selectionModel()
         if selection_model is None:
             return
-        selection_tokens: set[str] = set()
-        for index in selection_model.selectedRows():
-            item = self.question_table.item(index.row(), 0)
-            if not item:
-                continue
-            normalized = config.normalize_question_id(item.text())
-            if normalized:
-                selection_tokens.add(normalized)
-        current_manual_tokens: set[str] = set()
-        manual_text = self.manual_input.text().strip()
-        if manual_text:
-            for token in manual_text.split(","):
-                normalized = config.normalize_question_id(token)
-                if normalized:
-                    current_manual_tokens.add(normalized)
-        manual_extras = {token for token in current_manual_tokens if token not in self._last_selection_tokens}
+        selection_tokens = {self._miss_model.question_id(index.row()) for index in selection_model.selectedRows()}
+        selection_tokens.discard("")
+        manual_extras = _parse_question_ids(self.manual_input.text()).keys() - self._last_selection_tokens
         combined = sorted(manual_extras | selection_tokens)
         new_text = ",".join(combined)
         self._last_selection_tokens = selection_tokens
@@ -587,7 +692,7 @@ class GradeAdjustmentGui(QWidget):
         except OSError as exc:  # noqa: PERF203
             QMessageBox.critical(self, "Export failed", f"Could not write Canvas CSV: {exc}")
             return
-        self.output_view.append(f"Canvas export saved to {export_path}.\n")
+        self._output_log.append(f"Canvas export saved to {export_path}.\n")
         QMessageBox.information(
             self,
             "Canvas export created",
@@ -658,5 +763,7 @@ class GradeAdjustmentGui(QWidget):
 
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
+        if self._worker.is_busy():
+            return
         self._evaluate_inputs(show_message=False)
-        self._refresh_versions()
+        self._refresh_versions_async()
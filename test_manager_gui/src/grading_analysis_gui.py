@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import subprocess
-import sys
+import os
 from pathlib import Path
-from shlex import quote as shlex_quote
 
 import config
-from PyQt6.QtCore import Qt
+from cli_worker import CliWorker
+from output_log import OutputLog, display_command, open_path
+from PyQt6.QtCore import QProcess, QProcessEnvironment, Qt
 from PyQt6.QtGui import QDoubleValidator, QFont, QShowEvent
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -46,6 +46,28 @@ Question Analysis (analyze_misses.py):
 - Partial threshold controls how partial credit influences the miss calculation.
 - Outputs: miss_analysis/miss_report.csv and optional miss_report.log.
 """
+# Command parts that never change, stringified once instead of on every run.
+_PYTHON = str(config.PYTHON_EXECUTABLE)
+_GRADE_SCRIPT = str(config.CLI_PATH / "grade.py")
+_MISSES_SCRIPT = str(config.CLI_PATH / "analyze_misses.py")
+_CLI_DIR = str(config.CLI_PATH)
+
+
+class _ReviewButton(QPushButton):
+    """Disabled-by-default button that opens one of the tab's generated outputs."""
+
+    def __init__(self, tab: GradingAnalysisGui, text: str, tooltip: str, path_attr: str, label: str) -> None:
+        super().__init__(text)
+        self.setEnabled(False)
+        self.setToolTip(tooltip)
+        self._tab = tab
+        self._path_attr = path_attr
+        self._label = label
+        self.clicked.connect(self._open)
+
+    def _open(self) -> None:
+        # Read the path at click time; the tab refreshes it after every run.
+        self._tab._open_path(getattr(self._tab, self._path_attr), self._label)
 
 
 class GradingAnalysisGui(QWidget):
@@ -53,16 +75,34 @@ class GradingAnalysisGui(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        config.validate_cli_environment(["grade.py", "analyze_misses.py"])
-        self._grade_script = config.CLI_PATH / "grade.py"
-        self._misses_script = config.CLI_PATH / "analyze_misses.py"
+        config.validate_cli_environment(["grade.py", "analyze_misses.py", "worker.py"])
         self._results_csv: Path | None = None
         self._answer_key_csv: Path | None = None
         self._grades_csv_path: Path | None = None
         self._grades_xlsx_path: Path | None = None
         self._miss_report_path: Path | None = None
         self._miss_log_path: Path | None = None
+        self._existing_outputs: set[Path] = set()
+        self._pending_commands: list[tuple[str, list[str]]] = []
+        self._current_title = ""
+        self._pipeline_ok = True
+        self._stdout_buffer = b""
+        self._stderr_buffer = b""
+        self._process = QProcess(self)
+        self._process.setWorkingDirectory(_CLI_DIR)
+        environment = QProcessEnvironment.systemEnvironment()
+        environment.insert("PYTHONUNBUFFERED", "1")
+        self._process.setProcessEnvironment(environment)
+        self._process.readyReadStandardOutput.connect(self._read_stdout)
+        self._process.readyReadStandardError.connect(self._read_stderr)
+        self._process.errorOccurred.connect(self._handle_process_error)
+        self._process.finished.connect(self._handle_process_finished)
         self._init_ui()
+        # grade.py runs in a long-lived CLI worker so each click skips interpreter and pandas start-up.
+        self._grade_worker = CliWorker("grade", self)
+        self._grade_worker.output.connect(self._output_log.append)
+        self._grade_worker.start_failed.connect(self._handle_start_failed)
+        self._grade_worker.finished.connect(lambda exit_code: self._command_finished(success=exit_code == 0))
         self._evaluate_inputs(show_message=True)
         self._refresh_existing_outputs()
 
@@ -126,29 +166,29 @@ class GradingAnalysisGui(QWidget):
         review_layout.setContentsMargins(0, 0, 0, 0)
         review_layout.setSpacing(6)
 
-        self.review_grades_csv_button = QPushButton("Review Grades CSV")
-        self.review_grades_csv_button.setEnabled(False)
-        self.review_grades_csv_button.setToolTip("Open grades/graded_report.csv.")
-        self.review_grades_csv_button.clicked.connect(lambda: self._open_path(self._grades_csv_path, "student grades CSV"))
-        review_layout.addWidget(self.review_grades_csv_button, alignment=Qt.AlignmentFlag.AlignLeft)
-
-        self.review_grades_xlsx_button = QPushButton("Review Grades Excel")
-        self.review_grades_xlsx_button.setEnabled(False)
-        self.review_grades_xlsx_button.setToolTip("Open grades/graded_report.xlsx.")
-        self.review_grades_xlsx_button.clicked.connect(lambda: self._open_path(self._grades_xlsx_path, "student grades Excel workbook"))
-        review_layout.addWidget(self.review_grades_xlsx_button, alignment=Qt.AlignmentFlag.AlignLeft)
-
-        self.review_miss_button = QPushButton("Review Miss Report")
-        self.review_miss_button.setEnabled(False)
-        self.review_miss_button.setToolTip("Open miss_analysis/miss_report.csv.")
-        self.review_miss_button.clicked.connect(lambda: self._open_path(self._miss_report_path, "question miss report"))
-        review_layout.addWidget(self.review_miss_button, alignment=Qt.AlignmentFlag.AlignLeft)
-
-        self.review_miss_log_button = QPushButton("Review Miss Log")
-        self.review_miss_log_button.setEnabled(False)
-        self.review_miss_log_button.setToolTip("Open miss_analysis/miss_report.log.")
-        self.review_miss_log_button.clicked.connect(lambda: self._open_path(self._miss_log_path, "question miss log"))
-        review_layout.addWidget(self.review_miss_log_button, alignment=Qt.AlignmentFlag.AlignLeft)
+        self.review_grades_csv_button = _ReviewButton(
+            self, "Review Grades CSV", "Open grades/graded_report.csv.", "_grades_csv_path", "student grades CSV"
+        )
+        self.review_grades_xlsx_button = _ReviewButton(
+            self,
+            "Review Grades Excel",
+            "Open grades/graded_report.xlsx.",
+            "_grades_xlsx_path",
+            "student grades Excel workbook",
+        )
+        self.review_miss_button = _ReviewButton(
+            self, "Review Miss Report", "Open miss_analysis/miss_report.csv.", "_miss_report_path", "question miss report"
+        )
+        self.review_miss_log_button = _ReviewButton(
+            self, "Review Miss Log", "Open miss_analysis/miss_report.log.", "_miss_log_path", "question miss log"
+        )
+        for button in (
+            self.review_grades_csv_button,
+            self.review_grades_xlsx_button,
+            self.review_miss_button,
+            self.review_miss_log_button,
+        ):
+            review_layout.addWidget(button, alignment=Qt.AlignmentFlag.AlignLeft)
 
         button_layout.addWidget(review_row)
 
@@ -173,8 +213,11 @@ class GradingAnalysisGui(QWidget):
         mono = QFont("Courier New", 11)
         self.output_view.setFont(mono)
         self.output_view.setReadOnly(True)
+        self.output_view.document().setMaximumBlockCount(5000)
+        self.output_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         self.output_view.setMinimumHeight(230)
         self.output_view.setToolTip("Feedback from grading and analysis commands.")
+        self._output_log = OutputLog(self.output_view)
         output_layout.addWidget(self.output_view)
 
         main_layout.addWidget(
@@ -216,6 +259,8 @@ class GradingAnalysisGui(QWidget):
         return False
 
     def _run_pipeline(self) -> None:
+        if self._process.state() != QProcess.ProcessState.NotRunning or self._grade_worker.is_busy():
+            return
         if not self._evaluate_inputs(show_message=False):
             QMessageBox.warning(self, "Missing inputs", "Check that results.csv and the answer key are available.")
             return
@@ -228,12 +273,16 @@ class GradingAnalysisGui(QWidget):
         miss_dir = active_folder / "miss_analysis"
         miss_dir.mkdir(parents=True, exist_ok=True)
 
+        # Both commands share the input paths; stringify them once.
+        results_csv = str(self._results_csv)
+        answer_key_csv = str(self._answer_key_csv)
+
         commands = []
         grade_cmd = [
-            str(config.PYTHON_EXECUTABLE),
-            str(self._grade_script),
-            str(self._results_csv),
-            str(self._answer_key_csv),
+            _PYTHON,
+            _GRADE_SCRIPT,
+            results_csv,
+            answer_key_csv,
             "--output-dir",
             str(grades_dir),
         ]
@@ -241,12 +290,12 @@ class GradingAnalysisGui(QWidget):
 
         if self.analysis_checkbox.isChecked():
             miss_cmd = [
-                str(config.PYTHON_EXECUTABLE),
-                str(self._misses_script),
+                _PYTHON,
+                _MISSES_SCRIPT,
                 "--results",
-                str(self._results_csv),
+                results_csv,
                 "--key",
-                str(self._answer_key_csv),
+                answer_key_csv,
                 "--output",
                 str(miss_dir / "miss_report.csv"),
                 "--miss-threshold",
@@ -259,48 +308,90 @@ class GradingAnalysisGui(QWidget):
             commands.append(("Question Analysis", miss_cmd))
 
         self.generate_button.setEnabled(False)
-        self.output_view.clear()
-        success = True
-
-        for title, command in commands:
-            self.output_view.append(f"$ {' '.join(shlex_quote(part) for part in command)}\n")
-            try:
-                result = subprocess.run(
-                    command,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    cwd=str(config.CLI_PATH),
-                )
-            except FileNotFoundError:
-                QMessageBox.critical(
-                    self,
-                    "Missing executable",
-                    "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
-                )
-                success = False
-                break
-            except subprocess.CalledProcessError as exc:  # noqa: PERF203
-                self.output_view.append(exc.stdout)
-                self.output_view.append(exc.stderr)
-                QMessageBox.critical(
-                    self,
-                    f"{title} failed",
-                    "The CLI command reported an error. See the output panel for details.",
-                )
-                success = False
-                break
-            else:
-                if result.stdout.strip():
-                    self.output_view.append(f"{title}:\n{result.stdout.strip()}\n")
-                if result.stderr.strip():
-                    self.output_view.append(result.stderr.strip() + "\n")
+        self.output_view.document().clear()
+        self.output_view.verticalScrollBar().setValue(0)
+        self.output_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self._output_log.discard()
+        self._pending_commands = commands
+        self._pipeline_ok = True
+        self._start_next_command()
+
+    def _start_next_command(self) -> None:
+        if not self._pending_commands:
+            self._finish_pipeline()
+            return
+        self._current_title, command = self._pending_commands.pop(0)
+        self._output_log.append(f"$ {display_command(command)}\n")
+        if command[1] == _GRADE_SCRIPT:
+            self._grade_worker.run(command[2:])
+            return
+        self._process.setProgram(command[0])
+        self._process.setArguments(command[1:])
+        self._process.start()
 
+    def _finish_pipeline(self) -> None:
+        self._pending_commands = []
         self.generate_button.setEnabled(True)
         self._refresh_existing_outputs()
 
-        if success:
-            self.output_view.append("Done. Use the review buttons to open the generated files.")
+        if self._pipeline_ok:
+            self._output_log.append("Done. Use the review buttons to open the generated files.")
+
+    def _read_stdout(self) -> None:
+        data = bytes(self._process.readAllStandardOutput())
+        self._stdout_buffer = self._append_lines(self._stdout_buffer + data)
+
+    def _read_stderr(self) -> None:
+        data = bytes(self._process.readAllStandardError())
+        self._stderr_buffer = self._append_lines(self._stderr_buffer + data)
+
+    def _append_lines(self, buffer: bytes) -> bytes:
+        """Append every complete line in ``buffer`` and return the unfinished tail."""
+
+        *lines, remainder = buffer.split(b"\n")
+        for line in lines:
+            self._output_log.append(line.decode(errors="replace").rstrip())
+        return remainder
+
+    def _flush_output(self) -> None:
+        self._read_stdout()
+        self._read_stderr()
+        for tail in (self._stdout_buffer, self._stderr_buffer):
+            text = tail.decode(errors="replace").rstrip()
+            if text:
+                self._output_log.append(text)
+        self._stdout_buffer = b""
+        self._stderr_buffer = b""
+
+    def _handle_process_error(self, error: QProcess.ProcessError) -> None:
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        self._handle_start_failed()
+
+    def _handle_start_failed(self) -> None:
+        QMessageBox.critical(
+            self,
+            "Missing executable",
+            "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
+        )
+        self._pipeline_ok = False
+        self._finish_pipeline()
+
+    def _handle_process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        self._flush_output()
+        self._command_finished(success=exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0)
+
+    def _command_finished(self, success: bool) -> None:
+        if not success:
+            QMessageBox.critical(
+                self,
+                f"{self._current_title} failed",
+                "The CLI command reported an error. See the output panel for details.",
+            )
+            self._pipeline_ok = False
+            self._finish_pipeline()
+            return
+        self._start_next_command()
 
     def _refresh_existing_outputs(self) -> None:
         active_folder = config.active_test_folder()
@@ -321,14 +412,30 @@ class GradingAnalysisGui(QWidget):
         self._update_review_buttons()
 
     def _update_review_buttons(self) -> None:
-        self.review_grades_csv_button.setEnabled(bool(self._grades_csv_path and self._grades_csv_path.exists()))
-        self.review_grades_xlsx_button.setEnabled(bool(self._grades_xlsx_path and self._grades_xlsx_path.exists()))
-        self.review_miss_button.setEnabled(bool(self._miss_report_path and self._miss_report_path.exists()))
-        self.review_miss_log_button.setEnabled(bool(self.analysis_log_checkbox.isChecked() and self._miss_log_path and self._miss_log_path.exists()))
+        # List each output folder once instead of stat-ing every report; _open_path
+        # reuses the result instead of re-checking.
+        outputs = [
+            path
+            for path in (self._grades_csv_path, self._grades_xlsx_path, self._miss_report_path, self._miss_log_path)
+            if path
+        ]
+        listings: dict[Path, set[str]] = {}
+        for folder in {path.parent for path in outputs}:
+            try:
+                with os.scandir(folder) as entries:
+                    listings[folder] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                listings[folder] = set()
+        self._existing_outputs = {path for path in outputs if path.name in listings[path.parent]}
+        existing = self._existing_outputs
+        self.review_grades_csv_button.setEnabled(self._grades_csv_path in existing)
+        self.review_grades_xlsx_button.setEnabled(self._grades_xlsx_path in existing)
+        self.review_miss_button.setEnabled(self._miss_report_path in existing)
+        self.review_miss_log_button.setEnabled(self.analysis_log_checkbox.isChecked() and self._miss_log_path in existing)
 
     def _open_path(self, path: Path | None, label: str) -> None:
         self._refresh_existing_outputs()
-        if not path or not path.exists():
+        if not path or path not in self._existing_outputs:
             QMessageBox.information(
                 self,
                 "File not found",
@@ -336,19 +443,19 @@ class GradingAnalysisGui(QWidget):
             )
             return
         try:
-            if sys.platform.startswith("win"):
-                subprocess.Popen(["cmd", "/c", "start", "", str(path)])
-            elif sys.platform == "darwin":
-                subprocess.Popen(["open", str(path)])
-            else:
-                subprocess.Popen(["xdg-open", str(path)])
+            open_path(path)
         except OSError as exc:  # noqa: PERF203
             QMessageBox.critical(self, "Viewer error", f"Could not open {path}: {exc}")
 
     def _show_tips(self) -> None:
+        self.output_view.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
         self.output_view.setPlainText(_GRADING_TIPS)
 
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
+        # _run_pipeline disabled the buttons; re-evaluating now would re-enable them mid-run.
+        if self._process.state() != QProcess.ProcessState.NotRunning or self._grade_worker.is_busy():
+            return
         self._evaluate_inputs(show_message=False)
         self._refresh_existing_outputs()
+
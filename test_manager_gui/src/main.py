@@ -2,33 +2,42 @@
 
 from __future__ import annotations
 
+import importlib
+import os
 import sys
 from pathlib import Path
 
-from typing import Optional
+from typing import Callable, Optional
 
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QApplication, QMainWindow, QMessageBox, QTabWidget, QWidget
 
-SRC_DIR = Path(__file__).resolve().parent
-PROJECT_ROOT = SRC_DIR.parent
+# abspath is pure string work; resolve() would add a realpath walk at startup.
+_SRC_DIR_STR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT_STR = os.path.dirname(_SRC_DIR_STR)
+SRC_DIR = Path(_SRC_DIR_STR)
+PROJECT_ROOT = Path(_PROJECT_ROOT_STR)
 
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+# The only sys.path bootstrap for the GUI: the script directory (SRC_DIR) is
+# already sys.path[0] when launched as ``python main.py``, so only the project
+# root needs adding for ``config``. Tab modules rely on this and never touch
+# sys.path themselves.
+if _PROJECT_ROOT_STR not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT_STR)
 
 import config
-from answer_key_gui import AnswerKeyGui
-from bubble_sheet_gui import BubbleSheetGui
-from grade_adjustment_gui import GradeAdjustmentGui
-from grading_analysis_gui import GradingAnalysisGui
-from pdf_to_png_gui import PdfToPngGui
-from qti_test_gui import QtiTestGui
-from scanner_gui import ScannerGui
 from test_manager_gui import TestManagerGui
 
 
+def _tab_factory(module_name: str, class_name: str, parent: QWidget) -> Callable[[], QWidget]:
+    """Return a factory that imports ``module_name`` only when its tab is first opened."""
+
+    def build() -> QWidget:
+        return getattr(importlib.import_module(module_name), class_name)(parent)
+
+    return build
+
+
 class BubblexanTabWidget(QTabWidget):
     """Tab widget that enforces selecting a test before other tabs open."""
 
@@ -36,6 +45,7 @@ class BubblexanTabWidget(QTabWidget):
         super().__init__()
         self._default_tab: Optional[QWidget] = None
         self._requires_test: dict[QWidget, bool] = {}
+        self._factories: dict[QWidget, Callable[[], QWidget]] = {}
         self.currentChanged.connect(self._handle_tab_change)
 
     def add_managed_tab(self, widget: QWidget, title: str, *, requires_test: bool) -> int:
@@ -45,19 +55,47 @@ class BubblexanTabWidget(QTabWidget):
             self._default_tab = widget
         return index
 
+    def add_lazy_tab(self, factory: Callable[[], QWidget], title: str, *, requires_test: bool) -> int:
+        """Add a placeholder page that is replaced by ``factory()`` the first time it is shown."""
+
+        placeholder = QWidget()
+        self._factories[placeholder] = factory
+        return self.add_managed_tab(placeholder, title, requires_test=requires_test)
+
+    def _build_tab(self, index: int, placeholder: QWidget) -> None:
+        try:
+            widget = self._factories[placeholder]()
+        except Exception as exc:  # noqa: BLE001 - an exception escaping a slot would abort the app
+            # Keep the factory so opening the tab again retries, e.g. after restoring bubblexan_cli.
+            QMessageBox.critical(self, "Could not open tab", f"{self.tabText(index)} failed to load:\n{exc}")
+            self._show_default_tab()
+            return
+        del self._factories[placeholder]
+        self._requires_test[widget] = self._requires_test.pop(placeholder)
+        title = self.tabText(index)
+        self.blockSignals(True)
+        self.removeTab(index)
+        self.insertTab(index, widget, title)
+        self.setCurrentIndex(index)
+        self.blockSignals(False)
+        placeholder.deleteLater()
+
     def _handle_tab_change(self, index: int) -> None:
         if index < 0:
             return
         widget = self.widget(index)
-        if not self._requires_test.get(widget, False):
-            return
-        if config.ACTIVE_TEST_NAME:
+        if not self._requires_test.get(widget, False) or config.ACTIVE_TEST_NAME:
+            if widget in self._factories:
+                self._build_tab(index, widget)
             return
         QMessageBox.warning(
             self,
             "Select a test",
             "Create or select a test in the Test Manager tab before opening other tools.",
         )
+        self._show_default_tab()
+
+    def _show_default_tab(self) -> None:
         if self._default_tab:
             self.blockSignals(True)
             self.setCurrentWidget(self._default_tab)
@@ -76,13 +114,15 @@ class BubblexanWindow(QMainWindow):
     def _init_ui(self) -> None:
         tabs = BubblexanTabWidget()
         tabs.add_managed_tab(TestManagerGui(self), "Test Manager", requires_test=False)
-        tabs.add_managed_tab(BubbleSheetGui(self), "Bubble Sheet Generator", requires_test=True)
-        tabs.add_managed_tab(QtiTestGui(self), "QTI Test Generator", requires_test=True)
-        tabs.add_managed_tab(AnswerKeyGui(self), "Answer Key Import", requires_test=True)
-        tabs.add_managed_tab(PdfToPngGui(self), "PDF to PNG Conversion", requires_test=True)
-        tabs.add_managed_tab(ScannerGui(self), "Bubble Sheet Scanner", requires_test=True)
-        tabs.add_managed_tab(GradingAnalysisGui(self), "Grading & Analysis", requires_test=True)
-        tabs.add_managed_tab(GradeAdjustmentGui(self), "Grade Adjustment", requires_test=True)
+        # Only the Test Manager is built up front; the other tools' modules are
+        # imported and their tabs constructed the first time the tab is opened.
+        tabs.add_lazy_tab(_tab_factory("bubble_sheet_gui", "BubbleSheetGui", self), "Bubble Sheet Generator", requires_test=True)
+        tabs.add_lazy_tab(_tab_factory("qti_test_gui", "QtiTestGui", self), "QTI Test Generator", requires_test=True)
+        tabs.add_lazy_tab(_tab_factory("answer_key_gui", "AnswerKeyGui", self), "Answer Key Import", requires_test=True)
+        tabs.add_lazy_tab(_tab_factory("pdf_to_png_gui", "PdfToPngGui", self), "PDF to PNG Conversion", requires_test=True)
+        tabs.add_lazy_tab(_tab_factory("scanner_gui", "ScannerGui", self), "Bubble Sheet Scanner", requires_test=True)
+        tabs.add_lazy_tab(_tab_factory("grading_analysis_gui", "GradingAnalysisGui", self), "Grading & Analysis", requires_test=True)
+        tabs.add_lazy_tab(_tab_factory("grade_adjustment_gui", "GradeAdjustmentGui", self), "Grade Adjustment", requires_test=True)
         self.setCentralWidget(tabs)
 
 
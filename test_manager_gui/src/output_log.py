@@ -0,0 +1,63 @@
+"""Log panel and viewer helpers shared by tabs that stream CLI output."""
+
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QTimer, QUrl
+from PyQt6.QtGui import QDesktopServices, QTextCursor
+from PyQt6.QtWidgets import QTextEdit
+
+
+class OutputLog(QObject):
+    """Batch lines for ``view`` and append them with one insert every 50 ms.
+
+    Appending each line separately relays out the document once per line, which
+    stalls the GUI when a CLI prints quickly.
+    """
+
+    def __init__(self, view: QTextEdit) -> None:
+        super().__init__(view)
+        self._view = view
+        self._buffer: deque[str] = deque()
+        self._timer = QTimer(self)
+        self._timer.setInterval(50)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, text: str) -> None:
+        self._buffer.append(text + "\n")
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending lines now, e.g. before a dialog or status line that must follow them."""
+
+        self._timer.stop()
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self._view.moveCursor(QTextCursor.MoveOperation.End)
+        self._view.insertPlainText(text)
+        self._view.moveCursor(QTextCursor.MoveOperation.End)
+
+    def discard(self) -> None:
+        """Drop pending lines, e.g. when the panel is cleared for a new run."""
+
+        self._timer.stop()
+        self._buffer.clear()
+
+
+def display_command(command: list[str]) -> str:
+    """Join ``command`` for the log panel, quoting only arguments that contain spaces."""
+
+    return " ".join(f'"{part}"' if " " in part else part for part in command)
+
+
+def open_path(path: Path) -> None:
+    """Open ``path`` with the desktop's default application; raise OSError if none is registered."""
+
+    # The desktop's default handler opens the file; no helper process is forked or waited on here.
+    if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(path))):
+        raise OSError(f"no application is registered for {path.name}")
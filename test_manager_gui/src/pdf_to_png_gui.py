@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import os
 import re
-import subprocess
-import sys
+import shutil
+import tempfile
+import zipfile
+from collections import deque
 from pathlib import Path
 
 import config
-from PyQt6.QtCore import Qt
+from output_log import OutputLog, display_command, open_path
+from PyQt6.QtCore import QProcess, QProcessEnvironment, Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QIntValidator
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -24,7 +28,11 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-_PREFIX_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+_PREFIX_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+# Command parts that never change, stringified once for every child process.
+_PYTHON = str(config.PYTHON_EXECUTABLE)
+_SCRIPT = str(config.CLI_PATH / "convert_pdf_to_png.py")
+_CLI_DIR = str(config.CLI_PATH)
 _TIPS_TEXT = """The PDF to PNG Conversion tab converts scanned bubble sheet PDFs into PNG images for processing by the Bubble Sheet Scanner.
 
 Workflow:
@@ -42,15 +50,83 @@ Tips:
 """
 
 
+def _gather_pdfs(source_path: Path) -> tuple[list[Path], Path | None]:
+    """Return the PDFs to convert and the temporary folder holding ZIP contents."""
+
+    if source_path.is_file() and source_path.suffix.lower() == ".pdf":
+        return [source_path], None
+
+    temp_dir: Path | None = None
+    root = source_path
+    if source_path.is_file():
+        try:
+            temp_dir = Path(tempfile.mkdtemp(prefix="bubblexan_pdf_"))
+            with zipfile.ZipFile(source_path) as archive:
+                archive.extractall(temp_dir)
+        # RuntimeError covers encrypted members and NotImplementedError unsupported
+        # compression; validate_pdf_input only reads member names, so both get here.
+        except (OSError, zipfile.BadZipFile, RuntimeError, NotImplementedError) as exc:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            raise ValueError(f"Could not extract ZIP archive: {exc}") from exc
+        root = temp_dir
+
+    try:
+        pdf_files = sorted(
+            pdf for pdf in root.rglob("*") if pdf.is_file() and pdf.suffix.lower() == ".pdf"
+        )
+    except OSError as exc:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        raise ValueError(f"Could not read the selected source: {exc}") from exc
+    if not pdf_files:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        raise ValueError("No PDF files found in the selected source.")
+    return pdf_files, temp_dir
+
+
+class _GatherWorker(QThread):
+    """Run _gather_pdfs off the GUI thread so extracting a large ZIP never freezes the window."""
+
+    done = pyqtSignal(list, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, source_path: Path, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._source_path = source_path
+
+    def run(self) -> None:
+        try:
+            pdf_files, temp_dir = _gather_pdfs(self._source_path)
+        # An exception escaping QThread.run aborts the whole application under PyQt6.
+        except (ValueError, OSError) as exc:
+            self.failed.emit(str(exc))
+            return
+        self.done.emit(pdf_files, temp_dir)
+
+
 class PdfToPngGui(QWidget):
     """Tab that wraps bubblexan_cli/convert_pdf_to_png.py."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         config.validate_cli_environment(["convert_pdf_to_png.py"])
-        self._script_path = config.CLI_PATH / "convert_pdf_to_png.py"
         self._last_output_dir: Path | None = None
         self._last_first_image: Path | None = None
+        self._active_params: dict[str, object] | None = None
+        self._had_previous_output = False
+        self._environment = QProcessEnvironment.systemEnvironment()
+        self._environment.insert("PYTHONUNBUFFERED", "1")
+        self._max_parallel = os.cpu_count() or 4
+        self._pending: deque[tuple[Path, str]] = deque()
+        self._active: dict[QProcess, Path] = {}
+        self._buffers: dict[QProcess, list[bytes]] = {}
+        self._done = 0
+        self._failed: list[str] = []
+        self._start_failed = False
+        self._dialog = QFileDialog(self)
+        self._dialog.setOption(QFileDialog.Option.DontUseNativeDialog, False)
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -150,7 +226,10 @@ class PdfToPngGui(QWidget):
         mono = QFont("Courier New", 11)
         self.output_view.setFont(mono)
         self.output_view.setReadOnly(True)
+        self.output_view.document().setMaximumBlockCount(5000)
+        self.output_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         self.output_view.setMinimumHeight(220)
+        self._output_log = OutputLog(self.output_view)
         self.output_view.setToolTip("CLI output and conversion tips appear here.")
         output_layout.addWidget(self.output_view)
 
@@ -167,25 +246,38 @@ class PdfToPngGui(QWidget):
             return config.TEST_BUILD_PATH
         return active_folder / "inputs" / "scans"
 
+    def _browse(self, caption: str, name_filter: str | None = None, *, directory: bool = False) -> str | None:
+        """Run the tab's shared file dialog from the scans folder and return the selection."""
+
+        dialog = self._dialog
+        dialog.setWindowTitle(caption)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dialog.setDirectory(str(self._default_scans_dir()))
+        if directory:
+            dialog.setFileMode(QFileDialog.FileMode.Directory)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        else:
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, False)
+            dialog.setNameFilter(name_filter or "")
+        if not dialog.exec():
+            return None
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else None
+
     def _choose_file(self) -> None:
-        start_dir = str(self._default_scans_dir())
-        selected, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select PDF or ZIP",
-            start_dir,
-            "PDF Files (*.pdf);;ZIP Files (*.zip);;All Files (*)",
-        )
+        selected = self._browse("Select PDF or ZIP", "PDF Files (*.pdf);;ZIP Files (*.zip);;All Files (*)")
         if selected:
             self.source_input.setText(selected)
 
     def _choose_folder(self) -> None:
-        start_dir = str(self._default_scans_dir())
-        selected = QFileDialog.getExistingDirectory(self, "Select Folder Containing PDFs", start_dir)
+        selected = self._browse("Select Folder Containing PDFs", directory=True)
         if selected:
             self.source_input.setText(selected)
 
     def _show_tips(self) -> None:
         self.output_view.clear()
+        self.output_view.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
         self.output_view.setPlainText(_TIPS_TEXT)
 
     def _collect_inputs(self) -> dict[str, object]:
@@ -198,17 +290,13 @@ class PdfToPngGui(QWidget):
             raise ValueError("Select a PDF file, folder, or ZIP archive to convert.")
         source_path = Path(source_text).expanduser()
 
-        errors = config.validate_pdf_input(source_path)
-        if errors:
-            raise ValueError(", ".join(errors))
-
         dpi_text = self.dpi_input.text().strip()
         if not dpi_text:
             raise ValueError("DPI value cannot be empty.")
-        try:
-            dpi = int(dpi_text)
-        except ValueError as exc:  # noqa: PERF203
-            raise ValueError("DPI must be a number between 100 and 600.") from exc
+        # The QIntValidator only lets digits through, so no try/except is needed.
+        if not dpi_text.isdecimal():
+            raise ValueError("DPI must be a number between 100 and 600.")
+        dpi = int(dpi_text)
         if not 100 <= dpi <= 600:
             raise ValueError("DPI must be between 100 and 600.")
 
@@ -222,6 +310,12 @@ class PdfToPngGui(QWidget):
         fmt_selection = self.format_select.currentText().strip().lower()
         fmt = "jpg" if fmt_selection == "jpg" else "png"
 
+        # Filesystem checks run last so typos in the form fail before any disk
+        # access; a folder source is walked recursively here.
+        errors = config.validate_pdf_input(source_path)
+        if errors:
+            raise ValueError(", ".join(errors))
+
         if not config.poppler_available():
             raise RuntimeError(
                 "Poppler (pdftoppm) is required. Install via 'apt install poppler-utils' (Ubuntu), "
@@ -231,24 +325,20 @@ class PdfToPngGui(QWidget):
         output_dir = active_folder / "scanned_images"
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        if source_path.is_file() and source_path.suffix.lower() == ".pdf":
-            source_flag = "pdf"
-        else:
-            source_flag = "folder"
-
-        first_image = output_dir / f"{prefix}_page01.{fmt}"
-
+        # "jobs" and "temp_dir" are filled in once _GatherWorker has found the PDFs.
         return {
             "source_path": source_path,
-            "source_flag": source_flag,
+            "jobs": [],
+            "temp_dir": None,
             "dpi": dpi,
             "fmt": fmt,
             "prefix": prefix,
             "output_dir": output_dir,
-            "first_image": first_image,
         }
 
     def _run_converter(self) -> None:
+        if self._active or self._active_params is not None:
+            return
         try:
             params = self._collect_inputs()
         except ValueError as exc:
@@ -258,59 +348,196 @@ class PdfToPngGui(QWidget):
             QMessageBox.critical(self, "Missing dependency", str(exc))
             return
 
-        command = self._build_command(params)
         self.convert_button.setEnabled(False)
         self.review_button.setEnabled(False)
-        self.output_view.clear()
-        self.output_view.append(f"$ {' '.join(shlex_quote(part) for part in command)}\n")
-
-        success = False
-        had_previous = self._last_output_dir is not None
-        try:
-            result = subprocess.run(
-                command,
-                check=True,
-                capture_output=True,
-                text=True,
-                cwd=str(config.CLI_PATH),
+        self.output_view.document().clear()
+        self.output_view.verticalScrollBar().setValue(0)
+        self.output_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self._output_log.discard()
+
+        self._active_params = params
+        self._had_previous_output = self._last_output_dir is not None
+        self._done = 0
+        self._failed = []
+        self._start_failed = False
+        source_path = params["source_path"]
+        if source_path.suffix.lower() == ".zip":
+            self._output_log.append(f"Extracting {source_path.name}...")
+        # Extracting a ZIP or walking a folder can take seconds, so the PDFs are gathered off the GUI thread.
+        worker = _GatherWorker(source_path, self)
+        worker.done.connect(lambda pdf_files, temp_dir: self._handle_pdfs_gathered(worker, pdf_files, temp_dir))
+        worker.failed.connect(lambda message: self._handle_gather_failed(worker, message))
+        worker.start()
+
+    def _handle_pdfs_gathered(self, worker: _GatherWorker, pdf_files: list[Path], temp_dir: Path | None) -> None:
+        worker.wait()
+        worker.deleteLater()
+        params = self._active_params
+        prefix = params["prefix"]
+        if len(pdf_files) == 1:
+            jobs = [(pdf_files[0], prefix)]
+        else:
+            # One process per PDF: give each its own prefix so parallel
+            # children never write the same page filenames.
+            jobs = [(pdf, f"{prefix}_{pdf.stem.replace(' ', '_')}") for pdf in pdf_files]
+        params["jobs"] = jobs
+        params["temp_dir"] = temp_dir
+        if len(jobs) > 1:
+            workers = min(self._max_parallel, len(jobs))
+            self._output_log.append(f"Converting {len(jobs)} PDFs with up to {workers} parallel processes.\n")
+        self._pending = deque(jobs)
+        self._start_next_jobs()
+
+    def _handle_gather_failed(self, worker: _GatherWorker, message: str) -> None:
+        worker.wait()
+        worker.deleteLater()
+        self._output_log.flush()
+        self._finish_conversion(success=False)
+        QMessageBox.warning(self, "Check your inputs", message)
+
+    def _start_next_jobs(self) -> None:
+        params = self._active_params
+        while params is not None and self._pending and len(self._active) < self._max_parallel:
+            pdf, prefix = self._pending.popleft()
+            command = self._build_command(params, pdf, prefix)
+            self._output_log.append(f"$ {display_command(command)}")
+
+            process = QProcess(self)
+            process.setWorkingDirectory(_CLI_DIR)
+            process.setProcessEnvironment(self._environment)
+            process.readyReadStandardOutput.connect(lambda p=process: self._read_stdout(p))
+            process.readyReadStandardError.connect(lambda p=process: self._read_stderr(p))
+            process.errorOccurred.connect(lambda error, p=process: self._handle_process_error(p, error))
+            process.finished.connect(
+                lambda code, status, p=process: self._handle_process_finished(p, code, status)
             )
-        except FileNotFoundError:
+            self._active[process] = pdf
+            self._buffers[process] = [b"", b""]
+            process.start(command[0], command[1:])
+
+    def _read_stdout(self, process: QProcess) -> None:
+        buffers = self._buffers[process]
+        data = bytes(process.readAllStandardOutput())
+        buffers[0] = self._append_lines(buffers[0] + data)
+
+    def _read_stderr(self, process: QProcess) -> None:
+        buffers = self._buffers[process]
+        data = bytes(process.readAllStandardError())
+        buffers[1] = self._append_lines(buffers[1] + data)
+
+    def _append_lines(self, buffer: bytes) -> bytes:
+        """Append every complete line in ``buffer`` and return the unfinished tail."""
+
+        *lines, remainder = buffer.split(b"\n")
+        for line in lines:
+            self._output_log.append(line.decode(errors="replace").rstrip())
+        return remainder
+
+    def _flush_output(self, process: QProcess) -> None:
+        self._read_stdout(process)
+        self._read_stderr(process)
+        for tail in self._buffers.pop(process):
+            text = tail.decode(errors="replace").rstrip()
+            if text:
+                self._output_log.append(text)
+
+    def _handle_process_error(self, process: QProcess, error: QProcess.ProcessError) -> None:
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        # A process that never started emits no finished() signal.
+        if not self._start_failed:
+            self._start_failed = True
+            self._pending.clear()
             QMessageBox.critical(
                 self,
                 "Missing executable",
                 "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
             )
+        self._buffers.pop(process, None)
+        self._child_done(process, success=False)
+
+    def _handle_process_finished(
+        self,
+        process: QProcess,
+        exit_code: int,
+        exit_status: QProcess.ExitStatus,
+    ) -> None:
+        self._flush_output(process)
+        success = exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0
+        self._child_done(process, success=success)
+
+    def _child_done(self, process: QProcess, success: bool) -> None:
+        pdf = self._active.pop(process, None)
+        process.deleteLater()
+        params = self._active_params
+        if pdf is None or params is None:
+            return
+
+        self._done += 1
+        if not success:
+            self._failed.append(pdf.name)
+        total = len(params["jobs"])
+        if total > 1:
+            status = "converted" if success else "FAILED"
+            self._output_log.append(f"[{self._done}/{total}] {pdf.name} {status}")
+
+        self._start_next_jobs()
+        if self._active:
+            return
+
+        temp_dir = params["temp_dir"]
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        if self._start_failed:
+            self._finish_conversion(success=False)
             return
-        except subprocess.CalledProcessError as exc:
-            if exc.stdout:
-                self.output_view.append(exc.stdout)
-            if exc.stderr:
-                self.output_view.append(exc.stderr)
+        if len(self._failed) == total:
             QMessageBox.critical(
                 self,
                 "Conversion failed",
                 "The CLI command reported an error. See the output panel for details.",
             )
-        else:
-            for chunk in (result.stdout.strip(), result.stderr.strip()):
-                if chunk:
-                    self.output_view.append(chunk + "\n")
-            self.output_view.append(
-                f"Images saved to {params['output_dir']}\nFirst image: {params['first_image']}"
-            )
-            self._last_output_dir = params["output_dir"]
-            self._last_first_image = params["first_image"]
+            self._finish_conversion(success=False)
+            return
+
+        if self._failed:
+            self._output_log.append(f"\nSkipped {len(self._failed)} PDF(s): {', '.join(self._failed)}")
+        first_image = self._find_first_image(params)
+        self._output_log.append(f"Images saved to {params['output_dir']}")
+        if first_image:
+            self._output_log.append(f"First image: {first_image}")
+        self._last_output_dir = params["output_dir"]
+        self._last_first_image = first_image
+        self._finish_conversion(success=True)
+
+    def _find_first_image(self, params: dict[str, object]) -> Path | None:
+        """Return the alphabetically first page written by this run, in one directory pass."""
+
+        output_dir = params["output_dir"]
+        prefixes = tuple(f"{prefix}_page" for _, prefix in params["jobs"])
+        suffix = f".{params['fmt']}"
+        best: str | None = None
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefixes) and name.endswith(suffix) and (best is None or name < best):
+                    best = name
+        return output_dir / best if best else None
+
+    def _finish_conversion(self, success: bool) -> None:
+        self._active_params = None
+        self._pending.clear()
+        self.convert_button.setEnabled(True)
+        if success or (self._had_previous_output and self._last_output_dir):
             self.review_button.setEnabled(True)
-            success = True
-        finally:
-            self.convert_button.setEnabled(True)
-            if not success and had_previous and self._last_output_dir:
-                self.review_button.setEnabled(True)
-
-    def _build_command(self, params: dict[str, object]) -> list[str]:
-        cmd = [
-            str(config.PYTHON_EXECUTABLE),
-            str(self._script_path),
+
+    def _build_command(self, params: dict[str, object], pdf: Path, prefix: str) -> list[str]:
+        return [
+            _PYTHON,
+            _SCRIPT,
+            "--pdf",
+            str(pdf),
             "--output-dir",
             str(params["output_dir"]),
             "--dpi",
@@ -318,13 +545,8 @@ class PdfToPngGui(QWidget):
             "--fmt",
             str(params["fmt"]),
             "--prefix",
-            str(params["prefix"]),
+            prefix,
         ]
-        if params["source_flag"] == "pdf":
-            cmd.extend(["--pdf", str(params["source_path"])])
-        else:
-            cmd.extend(["--folder", str(params["source_path"])])
-        return cmd
 
     def _review_images(self) -> None:
         target = self._last_output_dir
@@ -337,11 +559,11 @@ class PdfToPngGui(QWidget):
             return
 
         try:
-            self._open_path(target)
+            open_path(target)
         except OSError:
             if self._last_first_image and self._last_first_image.exists():
                 try:
-                    self._open_path(self._last_first_image)
+                    open_path(self._last_first_image)
                     return
                 except OSError as exc:  # noqa: PERF203
                     QMessageBox.critical(self, "Viewer error", f"Could not open images: {exc}")
@@ -351,21 +573,3 @@ class PdfToPngGui(QWidget):
                     "Viewer error",
                     "Could not open the output folder or any image file.",
                 )
-
-    def _open_path(self, path: Path) -> None:
-        if sys.platform.startswith("win"):
-            subprocess.Popen(["explorer", str(path)])
-        elif sys.platform == "darwin":
-            subprocess.Popen(["open", str(path)])
-        else:
-            subprocess.Popen(["xdg-open", str(path)])
-
-
-def shlex_quote(text: str) -> str:
-    """Minimal shlex quoting to display commands in QTextEdit."""
-
-    if not text:
-        return "''"
-    if all(ch.isalnum() or ch in "-._/:" for ch in text):
-        return text
-    return "'" + text.replace("'", "'\"'\"'") + "'"
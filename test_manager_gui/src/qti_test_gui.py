@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
+import os
 import re
 import shlex
-import subprocess
-import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TypedDict
 
 import config
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QShowEvent
+from cli_worker import CliWorker
+from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtGui import QDesktopServices, QFont, QShowEvent, QTextCursor
 from PyQt6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -31,7 +31,8 @@ _XML_FILTER = "XML Files (*.xml);;All Files (*)"
 _ZIP_FILTER = "ZIP Archives (*.zip);;All Files (*)"
 
 
-class _FormValues(TypedDict):
+@dataclass(frozen=True, slots=True)
+class _FormValues:
     use_zip: bool
     zip_path: Path | None
     qti_path: Path | None
@@ -49,11 +50,27 @@ class QtiTestGui(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        config.validate_cli_environment(["generate_test_from_qti.py"])
+        config.validate_cli_environment(["generate_test_from_qti.py", "worker.py"])
         self._script_path = config.CLI_PATH / "generate_test_from_qti.py"
         self._last_pdf: Path | None = None
         self._last_csv: Path | None = None
+        self._active_params: _FormValues | None = None
+        self._had_previous_output = False
+        self._pending_echo: str | None = None
+        self._last_command: tuple[_FormValues, list[str]] | None = None
+        # Browse button -> (target field, caption, name filter, pick a directory).
+        self._browse_targets: dict[QPushButton, tuple[QLineEdit, str, str | None, bool]] = {}
+        # Validated paths keyed by (kind, raw field text); cleared whenever a path field is edited.
+        self._path_cache: dict[str, Path] = {}
+        self._mkdir_done: set[Path] = set()
+        self._dialog = QFileDialog(self)
+        self._dialog.setOption(QFileDialog.Option.DontUseNativeDialog, False)
         self._init_ui()
+        # One preloaded generator process serves every run from this tab.
+        self._worker = CliWorker("generate_test_from_qti", self)
+        self._worker.output.connect(self._append_output)
+        self._worker.start_failed.connect(self._handle_start_failed)
+        self._worker.finished.connect(self._handle_generator_finished)
         self._refresh_existing_outputs()
 
     def _init_ui(self) -> None:
@@ -72,24 +89,24 @@ class QtiTestGui(QWidget):
         self.source_input = QLineEdit()
         self.source_input.setPlaceholderText("Path to Canvas QTI folder or ZIP")
         self.source_input.setToolTip("Select a folder or ZIP that contains a Canvas QTI export.")
+        self.source_input.textChanged.connect(self._forget_paths)
 
-        source_controls = QWidget()
-        source_layout = QHBoxLayout(source_controls)
+        source_layout = QHBoxLayout()
         source_layout.setContentsMargins(0, 0, 0, 0)
         source_layout.setSpacing(6)
         source_layout.addWidget(self.source_input)
 
         browse_folder_btn = QPushButton("Folder…")
         browse_folder_btn.setToolTip("Choose a folder that contains Canvas QTI files.")
-        browse_folder_btn.clicked.connect(self._choose_folder)
+        self._add_browse_target(browse_folder_btn, self.source_input, "Select QTI Folder", directory=True)
         source_layout.addWidget(browse_folder_btn)
 
         browse_zip_btn = QPushButton("ZIP…")
         browse_zip_btn.setToolTip("Choose a Canvas QTI ZIP archive.")
-        browse_zip_btn.clicked.connect(self._choose_zip)
+        self._add_browse_target(browse_zip_btn, self.source_input, "Select QTI ZIP Archive", _ZIP_FILTER)
         source_layout.addWidget(browse_zip_btn)
 
-        form_layout.addRow("QTI Source:", source_controls)
+        form_layout.addRow("QTI Source:", source_layout)
 
         self.page_size_select = QComboBox()
         self.page_size_select.addItems(["A4", "LETTER"])
@@ -105,19 +122,19 @@ class QtiTestGui(QWidget):
             "QTI XML Override:",
             "Choose a specific QTI XML file to use instead of auto-detecting one from the folder.",
         )
-        form_layout.addRow("QTI XML Override:", self.qti_override["container"])
+        form_layout.addRow("QTI XML Override:", self.qti_override["layout"])
 
         self.meta_override = self._build_override_field(
             "Assessment Meta Override:",
             "Choose a custom assessment_meta.xml file.",
         )
-        form_layout.addRow("assessment_meta.xml:", self.meta_override["container"])
+        form_layout.addRow("assessment_meta.xml:", self.meta_override["layout"])
 
         self.manifest_override = self._build_override_field(
             "IMS Manifest Override:",
             "Choose a custom imsmanifest.xml file.",
         )
-        form_layout.addRow("imsmanifest.xml:", self.manifest_override["container"])
+        form_layout.addRow("imsmanifest.xml:", self.manifest_override["layout"])
 
         content_layout.addLayout(form_layout)
 
@@ -178,49 +195,63 @@ class QtiTestGui(QWidget):
 
         main_layout.addStretch()
 
-    def _build_override_field(self, label_text: str, tooltip: str) -> dict[str, QWidget | QLineEdit]:
-        container = QWidget()
-        layout = QHBoxLayout(container)
+    def _build_override_field(self, label_text: str, tooltip: str) -> dict[str, QHBoxLayout | QLineEdit]:
+        layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(6)
 
         line_edit = QLineEdit()
         line_edit.setToolTip(tooltip)
         line_edit.setPlaceholderText(label_text.replace("Override:", "").strip())
+        line_edit.textChanged.connect(self._forget_paths)
         layout.addWidget(line_edit)
 
         browse_btn = QPushButton("Browse…")
         browse_btn.setToolTip(tooltip)
-        browse_btn.clicked.connect(lambda: self._choose_file(line_edit, _XML_FILTER))
+        self._add_browse_target(browse_btn, line_edit, "Select File", _XML_FILTER)
         layout.addWidget(browse_btn)
 
-        return {"container": container, "input": line_edit}
-
-    def _choose_folder(self) -> None:
-        selected = QFileDialog.getExistingDirectory(self, "Select QTI Folder")
-        if selected:
-            self.source_input.setText(selected)
-
-    def _choose_zip(self) -> None:
-        selected, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select QTI ZIP Archive",
-            filter=_ZIP_FILTER,
-        )
-        if selected:
-            self.source_input.setText(selected)
+        return {"layout": layout, "input": line_edit}
+
+    def _add_browse_target(
+        self,
+        button: QPushButton,
+        line_edit: QLineEdit,
+        caption: str,
+        name_filter: str | None = None,
+        *,
+        directory: bool = False,
+    ) -> None:
+        self._browse_targets[button] = (line_edit, caption, name_filter, directory)
+        button.clicked.connect(self._on_browse)
+
+    def _browse(self, caption: str, name_filter: str | None = None, *, directory: bool = False) -> str | None:
+        """Run the tab's shared file dialog and return the selected path, if any."""
+
+        dialog = self._dialog
+        dialog.setWindowTitle(caption)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        if directory:
+            dialog.setFileMode(QFileDialog.FileMode.Directory)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        else:
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, False)
+            dialog.setNameFilter(name_filter or "")
+        if not dialog.exec():
+            return None
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else None
 
-    def _choose_file(self, line_edit: QLineEdit, file_filter: str) -> None:
-        selected, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select File",
-            filter=file_filter,
-        )
+    def _on_browse(self) -> None:
+        line_edit, caption, name_filter, directory = self._browse_targets[self.sender()]
+        selected = self._browse(caption, name_filter, directory=directory)
         if selected:
             line_edit.setText(selected)
 
     def _open_file(self, path: Path | None, label: str) -> None:
-        if not path or not path.exists():
+        # Callers refresh first, which leaves the path unset when the file is missing.
+        if not path:
             QMessageBox.information(
                 self,
                 "File not found",
@@ -228,18 +259,12 @@ class QtiTestGui(QWidget):
             )
             return
 
-        try:
-            if sys.platform.startswith("win"):
-                subprocess.Popen(["cmd", "/c", "start", "", str(path)])
-            elif sys.platform == "darwin":
-                subprocess.Popen(["open", str(path)])
-            else:
-                subprocess.Popen(["xdg-open", str(path)])
-        except OSError as exc:  # noqa: PERF203
+        # The desktop's default handler opens the file; no shell or helper process is forked here.
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(path))):
             QMessageBox.critical(
                 self,
                 "Viewer error",
-                f"Could not open the file: {exc}",
+                f"Could not open the file: no application is registered for {path.name}.",
             )
 
     def _collect_inputs(self) -> _FormValues:
@@ -248,26 +273,14 @@ class QtiTestGui(QWidget):
             raise ValueError("No test selected. Please select a test in the Test Manager tab.")
 
         tests_dir = active_folder / "tests"
-        tests_dir.mkdir(parents=True, exist_ok=True)
+        if tests_dir not in self._mkdir_done:
+            tests_dir.mkdir(parents=True, exist_ok=True)
+            self._mkdir_done.add(tests_dir)
 
         source_text = self.source_input.text().strip()
         if not source_text:
             raise ValueError("Select a folder or ZIP with Canvas QTI files.")
-        source_path = Path(source_text).expanduser()
-
-        if not source_path.exists():
-            raise ValueError("The selected QTI source does not exist.")
-
-        is_zip = source_path.is_file() and source_path.suffix.lower() == ".zip"
-        is_dir = source_path.is_dir()
-        if not is_zip and not is_dir:
-            raise ValueError("Select a folder or a .zip file that contains the QTI export.")
-
-        missing = config.validate_qti_source(source_path)
-        if missing:
-            raise ValueError(
-                "Cannot generate test. Missing files: " + ", ".join(missing)
-            )
+        source_path, is_zip = self._validate_source(source_text)
 
         prefix = self.prefix_input.text().strip() or (config.extract_exam_title() or "")
         if not prefix:
@@ -312,31 +325,63 @@ class QtiTestGui(QWidget):
         pdf_path = tests_dir / f"{prefix}_test.pdf"
         csv_path = tests_dir / f"{prefix}_answer_key.csv"
 
-        return {
-            "use_zip": use_zip,
-            "zip_path": zip_path,
-            "qti_path": qti_path,
-            "meta_path": meta_path,
-            "manifest_path": manifest_path,
-            "page_size": page_size,
-            "output_prefix": prefix,
-            "output_dir": tests_dir,
-            "pdf_path": pdf_path,
-            "csv_path": csv_path,
-        }
-
-    def _validate_override(self, widget_obj: QWidget | QLineEdit) -> Path | None:
+        return _FormValues(
+            use_zip=use_zip,
+            zip_path=zip_path,
+            qti_path=qti_path,
+            meta_path=meta_path,
+            manifest_path=manifest_path,
+            page_size=page_size,
+            output_prefix=prefix,
+            output_dir=tests_dir,
+            pdf_path=pdf_path,
+            csv_path=csv_path,
+        )
+
+    def _validate_override(self, widget_obj: QHBoxLayout | QLineEdit) -> Path | None:
         if not isinstance(widget_obj, QLineEdit):
             return None
         text = widget_obj.text().strip()
         if not text:
             return None
-        path = Path(text).expanduser()
+        path = self._expand(text)
         if not path.exists():
             raise ValueError(f"Override file '{path}' does not exist.")
         return path
 
+    def _validate_source(self, source_text: str) -> tuple[Path, bool]:
+        """Return the QTI source path and whether it is a ZIP, re-checking the disk on every run."""
+
+        source_path = self._expand(source_text)
+        if not source_path.exists():
+            raise ValueError("The selected QTI source does not exist.")
+
+        is_zip = source_path.is_file() and source_path.suffix.lower() == ".zip"
+        is_dir = source_path.is_dir()
+        if not is_zip and not is_dir:
+            raise ValueError("Select a folder or a .zip file that contains the QTI export.")
+
+        missing = config.validate_qti_source(source_path)
+        if missing:
+            raise ValueError(
+                "Cannot generate test. Missing files: " + ", ".join(missing)
+            )
+        return source_path, is_zip
+
+    def _expand(self, text: str) -> Path:
+        # Only the ~-expansion is cached: the export can change on disk between runs,
+        # so existence and file lookups must be repeated each time.
+        path = self._path_cache.get(text)
+        if path is None:
+            path = self._path_cache[text] = Path(text).expanduser()
+        return path
+
+    def _forget_paths(self, _text: str = "") -> None:
+        self._path_cache.clear()
+
     def _run_generator(self) -> None:
+        if self._worker.is_busy():
+            return
         try:
             params = self._collect_inputs()
         except ValueError as exc:
@@ -348,88 +393,109 @@ class QtiTestGui(QWidget):
         self.review_test_button.setEnabled(False)
         self.review_key_button.setEnabled(False)
         self.output_view.clear()
-        self.output_view.append(f"$ {shlex.join(command)}\n")
+        self._echo_command(command)
 
-        had_previous = self._last_pdf and self._last_pdf.exists() and self._last_csv and self._last_csv.exists()
-        success = False
-        try:
-            result = subprocess.run(
-                command,
-                check=True,
-                capture_output=True,
-                text=True,
-                cwd=str(config.CLI_PATH),
-            )
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
-                "Missing executable",
-                "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
-            )
-            return
-        except subprocess.CalledProcessError as exc:
-            if exc.stdout:
-                self.output_view.append(exc.stdout)
-            if exc.stderr:
-                self.output_view.append(exc.stderr)
+        self._active_params = params
+        # _last_pdf/_last_csv are only set for files seen on disk, so no need to stat them again.
+        self._had_previous_output = bool(self._last_pdf and self._last_csv)
+        self._worker.run(command[2:])
+
+    def _handle_start_failed(self) -> None:
+        QMessageBox.critical(
+            self,
+            "Missing executable",
+            "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
+        )
+        self._finish_generation(success=False)
+
+    def _handle_generator_finished(self, exit_code: int) -> None:
+        params = self._active_params
+        if exit_code != 0 or params is None:
             QMessageBox.critical(
                 self,
                 "Generator failed",
                 "The CLI command reported an error. See the output panel for details.",
             )
+            self._finish_generation(success=False)
+            return
+
+        self._append_bulk(["", self._format_summary(params)])
+        self._last_pdf = params.pdf_path
+        self._last_csv = params.csv_path
+        self._finish_generation(success=True)
+
+    def _echo_command(self, command: list[str]) -> None:
+        """Echo the command in shell-safe form; a hidden panel gets it with the next output instead."""
+
+        display = f"$ {shlex.join(command)}"
+        if self.output_view.isVisible():
+            self._append_bulk([display, ""])
         else:
-            for chunk in (result.stdout.strip(), result.stderr.strip()):
-                if chunk:
-                    self.output_view.append(chunk + "\n")
-            summary = self._format_summary(params)
-            self.output_view.append(summary)
-            self._last_pdf = params["pdf_path"]
-            self._last_csv = params["csv_path"]
+            self._pending_echo = display
+
+    def _append_output(self, text: str) -> None:
+        self._append_bulk([text])
+
+    def _append_bulk(self, lines: list[str]) -> None:
+        """Append ``lines`` as new paragraphs with one insert and one repaint."""
+
+        if self._pending_echo is not None:
+            lines = [self._pending_echo, "", *lines]
+            self._pending_echo = None
+        view = self.output_view
+        view.setUpdatesEnabled(False)
+        cursor = view.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        separator = "" if view.document().isEmpty() else "\n"
+        cursor.insertText(separator + "\n".join(lines))
+        view.setUpdatesEnabled(True)
+        scrollbar = view.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def _finish_generation(self, success: bool) -> None:
+        self._active_params = None
+        self.generate_button.setEnabled(True)
+        if success or self._had_previous_output:
             self.review_test_button.setEnabled(True)
             self.review_key_button.setEnabled(True)
-            success = True
-        finally:
-            self.generate_button.setEnabled(True)
-            if not success and had_previous:
-                self.review_test_button.setEnabled(True)
-                self.review_key_button.setEnabled(True)
 
     def _build_command(self, params: _FormValues) -> list[str]:
-        cmd = [
-            str(config.PYTHON_EXECUTABLE),
-            str(self._script_path),
-            "--output-dir",
-            str(params["output_dir"]),
-            "--output-prefix",
-            params["output_prefix"],
-            "--page-size",
-            params["page_size"],
+        # Re-running with unchanged inputs reuses the previous argv.
+        if self._last_command is not None and self._last_command[0] == params:
+            return self._last_command[1]
+        options: list[tuple[str, str | Path | None]] = [
+            ("--output-dir", params.output_dir),
+            ("--output-prefix", params.output_prefix),
+            ("--page-size", params.page_size),
         ]
-        if params["use_zip"]:
-            cmd.extend(["--zip", str(params["zip_path"])])
+        if params.use_zip:
+            options.append(("--zip", params.zip_path))
         else:
-            cmd.extend(
-                [
-                    "--qti",
-                    str(params["qti_path"]),
-                    "--meta",
-                    str(params["meta_path"]),
-                    "--manifest",
-                    str(params["manifest_path"]),
-                ]
-            )
+            options += [
+                ("--qti", params.qti_path),
+                ("--meta", params.meta_path),
+                ("--manifest", params.manifest_path),
+            ]
+        cmd = [os.fspath(config.PYTHON_EXECUTABLE), os.fspath(self._script_path)]
+        cmd += [part for flag, value in options for part in (flag, os.fspath(value))]
+        self._last_command = (params, cmd)
         return cmd
 
     def _format_summary(self, params: _FormValues) -> str:
         lines = [
             "Generated files:",
-            str(params["pdf_path"]),
-            str(params["csv_path"]),
+            str(params.pdf_path),
+            str(params.csv_path),
         ]
         return "\n".join(lines)
 
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
+        if self._pending_echo is not None:
+            self._append_bulk([])
+        # _run_generator disabled the review buttons until the run finishes.
+        if self._worker.is_busy():
+            return
         self._refresh_existing_outputs()
 
     def _refresh_existing_outputs(self) -> None:
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import subprocess
-import sys
+import os
+import re
+import shlex
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 import config
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QDoubleValidator, QFont, QShowEvent
+from cli_worker import CliWorker
+from PyQt6.QtCore import QLocale, Qt, QUrl
+from PyQt6.QtGui import QDesktopServices, QDoubleValidator, QFont, QShowEvent, QTextCursor
 from PyQt6.QtWidgets import (
     QCheckBox,
     QFileDialog,
@@ -17,6 +22,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QTextEdit,
     QVBoxLayout,
@@ -31,6 +37,51 @@ Warning: Custom scans must be PNG files for scanning to work.
 
 _CUSTOM_WARNING = "Custom scans must be PNG files for scanning to work."
 
+# "[n/total] Scanning <name>" lines printed by scan_bubblesheet.py --progress.
+_PROGRESS_PATTERN = re.compile(r"\[(\d+)/(\d+)\] ")
+
+# Shared by every scanner tab; the C locale keeps accepted text parseable by float().
+_THRESHOLD_VALIDATOR = QDoubleValidator(0.0, 1.0, 3)
+_THRESHOLD_VALIDATOR.setNotation(QDoubleValidator.Notation.StandardNotation)
+_THRESHOLD_VALIDATOR.setLocale(QLocale.c())
+
+
+
+class _ScannerPaths(NamedTuple):
+    images_dir: Path
+    layout_json: Path | None
+    results_dir: Path
+    results_csv: Path
+    results_log: Path
+
+
+@lru_cache(maxsize=None)
+def _scanner_paths(test_name: str) -> _ScannerPaths:
+    """Derive the scanner's default paths once per test folder name."""
+
+    folder = config.TEST_BUILD_PATH / test_name
+    results_dir = folder / "results"
+    return _ScannerPaths(
+        images_dir=folder / "scanned_images",
+        layout_json=config.layout_json_path(folder, config.extract_exam_title(test_name)),
+        results_dir=results_dir,
+        results_csv=results_dir / "results.csv",
+        results_log=results_dir / "results.log",
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _FormValues:
+    source_path: Path
+    source_flag: str
+    layout_path: Path
+    threshold: float
+    results_dir: Path
+    csv_path: Path
+    log_path: Path
+    log_enabled: bool
+
+
 _TIPS_TEXT = """The Bubble Sheet Scanner tab processes PNG images of scanned bubble sheets to extract student answers, producing a results CSV for grading.
 
 Workflow:
@@ -54,13 +105,23 @@ class ScannerGui(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        config.validate_cli_environment(["scan_bubblesheet.py"])
+        config.validate_cli_environment(["scan_bubblesheet.py", "worker.py"])
         self._script_path = config.CLI_PATH / "scan_bubblesheet.py"
         self._results_csv: Path | None = None
         self._results_log: Path | None = None
         self._source_path: Path | None = None
         self._layout_path: Path | None = None
+        self._pending_echo: str | None = None
+        self._last_command: tuple[_FormValues, list[str]] | None = None
+        self._mkdir_done: set[Path] = set()
+        self._dialog = QFileDialog(self)
+        self._dialog.setOption(QFileDialog.Option.DontUseNativeDialog, False)
         self._init_ui()
+        # One preloaded scanner process (OpenCV already imported) serves every scan.
+        self._worker = CliWorker("scan_bubblesheet", self)
+        self._worker.output.connect(self._append_output)
+        self._worker.start_failed.connect(self._handle_start_failed)
+        self._worker.finished.connect(self._handle_scanner_finished)
         self._evaluate_source_state(show_message=True)
         self._refresh_existing_outputs()
 
@@ -91,10 +152,9 @@ class ScannerGui(QWidget):
         self.custom_input.setPlaceholderText("Browse for custom PNG, folder, or ZIP")
         self.custom_input.setToolTip(f"Select PNG images, a folder, or ZIP archive of scanned bubble sheets. {_CUSTOM_WARNING}")
         self.custom_input.setEnabled(False)
-        self.custom_input.textChanged.connect(lambda _: self._evaluate_source_state(show_message=True))
+        self.custom_input.textChanged.connect(self._handle_custom_text_changed)
 
-        custom_controls = QWidget()
-        custom_layout = QHBoxLayout(custom_controls)
+        custom_layout = QHBoxLayout()
         custom_layout.setContentsMargins(0, 0, 0, 0)
         custom_layout.setSpacing(6)
         custom_layout.addWidget(self.custom_input)
@@ -105,12 +165,10 @@ class ScannerGui(QWidget):
         self.custom_browse.clicked.connect(self._choose_custom_path)
         custom_layout.addWidget(self.custom_browse)
 
-        form_layout.addRow("Custom Source:", custom_controls)
+        form_layout.addRow("Custom Source:", custom_layout)
 
         self.threshold_input = QLineEdit("0.5")
-        threshold_validator = QDoubleValidator(0.0, 1.0, 3, self)
-        threshold_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
-        self.threshold_input.setValidator(threshold_validator)
+        self.threshold_input.setValidator(_THRESHOLD_VALIDATOR)
         self.threshold_input.setToolTip("Bubble fill detection threshold (0.0–1.0). Default: 0.5")
         form_layout.addRow("Threshold:", self.threshold_input)
 
@@ -132,6 +190,13 @@ class ScannerGui(QWidget):
         self.scan_button.clicked.connect(self._run_scanner)
         button_layout.addWidget(self.scan_button)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(200)
+        self.progress_bar.setFormat("Image %v of %m")
+        self.progress_bar.setToolTip("Images scanned so far in the current run.")
+        self.progress_bar.hide()
+        button_layout.addWidget(self.progress_bar)
+
         self.review_results_button = QPushButton("Review Results")
         self.review_results_button.setFixedWidth(160)
         self.review_results_button.setEnabled(False)
@@ -185,23 +250,33 @@ class ScannerGui(QWidget):
         main_layout.addStretch()
 
     def _default_images_dir(self) -> Path:
-        active_folder = config.active_test_folder()
-        if not active_folder:
+        if not config.ACTIVE_TEST_NAME:
             return config.TEST_BUILD_PATH
-        return active_folder / "scanned_images"
+        return _scanner_paths(config.ACTIVE_TEST_NAME).images_dir
+
+    def _browse(self, caption: str, name_filter: str | None = None, *, directory: bool = False) -> str | None:
+        """Run the tab's shared file dialog from the scanned images folder and return the selection."""
+
+        dialog = self._dialog
+        dialog.setWindowTitle(caption)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dialog.setDirectory(str(self._default_images_dir()))
+        if directory:
+            dialog.setFileMode(QFileDialog.FileMode.Directory)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        else:
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, False)
+            dialog.setNameFilter(name_filter or "")
+        if not dialog.exec():
+            return None
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else None
 
     def _choose_custom_path(self) -> None:
-        start_dir = str(self._default_images_dir())
-        selected, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select PNG or ZIP",
-            start_dir,
-            "PNG Files (*.png);;ZIP Files (*.zip);;All Files (*)",
-        )
+        selected = self._browse("Select PNG or ZIP", "PNG Files (*.png);;ZIP Files (*.zip);;All Files (*)")
         if not selected:
-            folder = QFileDialog.getExistingDirectory(self, "Select Folder Containing PNGs", start_dir)
-            if folder:
-                selected = folder
+            selected = self._browse("Select Folder Containing PNGs", directory=True)
         if selected:
             self.custom_input.setText(selected)
 
@@ -209,7 +284,7 @@ class ScannerGui(QWidget):
         self.output_view.clear()
         self.output_view.setPlainText(_TIPS_TEXT)
 
-    def _collect_inputs(self) -> dict[str, object]:
+    def _collect_inputs(self) -> _FormValues:
         ready = self._evaluate_source_state(show_message=False)
         if not ready:
             raise ValueError("PNG inputs are not ready. Follow the guidance above.")
@@ -217,39 +292,43 @@ class ScannerGui(QWidget):
         assert self._source_path is not None
         assert self._layout_path is not None
 
-        threshold_text = self.threshold_input.text().strip() or "0.5"
-        try:
-            threshold = float(threshold_text)
-        except ValueError as exc:  # noqa: PERF203
-            raise ValueError("Threshold must be a number between 0.0 and 1.0.") from exc
-        if not 0.0 < threshold <= 1.0:
+        threshold_text = self.threshold_input.text().strip()
+        if threshold_text and not self.threshold_input.hasAcceptableInput():
+            raise ValueError("Threshold must be a number between 0.0 and 1.0.")
+        # Acceptable validator input is always a plain C-locale decimal in [0, 1].
+        threshold = float(threshold_text or "0.5")
+        if threshold == 0.0:
             raise ValueError("Threshold must be between 0.0 and 1.0.")
 
-        active_folder = config.active_test_folder()
-        assert active_folder is not None
-        results_dir = active_folder / "results"
-        results_dir.mkdir(parents=True, exist_ok=True)
+        assert config.ACTIVE_TEST_NAME
+        paths = _scanner_paths(config.ACTIVE_TEST_NAME)
+        results_dir = paths.results_dir
+        if results_dir not in self._mkdir_done:
+            results_dir.mkdir(parents=True, exist_ok=True)
+            self._mkdir_done.add(results_dir)
 
-        csv_path = results_dir / "results.csv"
-        log_path = results_dir / "results.log"
+        csv_path = paths.results_csv
+        log_path = paths.results_log
 
-        if self._source_path.is_file() and self._source_path.suffix.lower() == ".png":
+        if self._source_path.suffix.lower() == ".png" and self._source_path.is_file():
             source_flag = "image"
         else:
             source_flag = "folder"
 
-        return {
-            "source_path": self._source_path,
-            "source_flag": source_flag,
-            "layout_path": self._layout_path,
-            "threshold": threshold,
-            "results_dir": results_dir,
-            "csv_path": csv_path,
-            "log_path": log_path,
-            "log_enabled": self.log_checkbox.isChecked(),
-        }
+        return _FormValues(
+            source_path=self._source_path,
+            source_flag=source_flag,
+            layout_path=self._layout_path,
+            threshold=threshold,
+            results_dir=results_dir,
+            csv_path=csv_path,
+            log_path=log_path,
+            log_enabled=self.log_checkbox.isChecked(),
+        )
 
     def _run_scanner(self) -> None:
+        if self._worker.is_busy():
+            return
         try:
             params = self._collect_inputs()
         except ValueError as exc:
@@ -261,72 +340,95 @@ class ScannerGui(QWidget):
         self.review_results_button.setEnabled(False)
         self.review_log_button.setEnabled(False)
         self.output_view.clear()
-        self.output_view.append(f"$ {' '.join(shlex_quote(part) for part in command)}\n")
+        self._echo_command(command)
+        self.progress_bar.setRange(0, 0)  # busy until the first progress line arrives
+        self.progress_bar.show()
 
-        success = False
-        try:
-            result = subprocess.run(
-                command,
-                check=True,
-                capture_output=True,
-                text=True,
-                cwd=str(config.CLI_PATH),
-            )
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
-                "Missing executable",
-                "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
-            )
-            return
-        except subprocess.CalledProcessError as exc:
-            if exc.stdout:
-                self.output_view.append(exc.stdout)
-            if exc.stderr:
-                self.output_view.append(exc.stderr)
+        self._worker.run(command[2:])
+
+    def _handle_start_failed(self) -> None:
+        QMessageBox.critical(
+            self,
+            "Missing executable",
+            "Could not find the CLI Python interpreter. Verify bubblexan_cli/.venv exists.",
+        )
+        self._finish_scan()
+
+    def _handle_scanner_finished(self, exit_code: int) -> None:
+        if exit_code != 0:
             QMessageBox.critical(
                 self,
                 "Scanner failed",
                 "The CLI command reported an error. See the output panel for details.",
             )
+        self._finish_scan()
+
+    def _echo_command(self, command: list[str]) -> None:
+        """Echo the command in shell-safe form; a hidden panel gets it with the next output instead."""
+
+        display = f"$ {shlex.join(command)}"
+        if self.output_view.isVisible():
+            self._append_bulk([display, ""])
         else:
-            for chunk in (result.stdout.strip(), result.stderr.strip()):
-                if chunk:
-                    self.output_view.append(chunk + "\n")
-            success = True
-        finally:
-            self.scan_button.setEnabled(True)
-            self._refresh_existing_outputs()
-            if not success and self._results_csv:
-                self.review_results_button.setEnabled(True)
-            if not success and self._results_log:
-                self.review_log_button.setEnabled(True)
-
-    def _build_command(self, params: dict[str, object]) -> list[str]:
-        cmd = [
-            str(config.PYTHON_EXECUTABLE),
-            str(self._script_path),
-            "--json",
-            str(params["layout_path"]),
-            "--output",
-            "results.csv",
-            "--output-dir",
-            str(params["results_dir"]),
-            "--threshold",
-            str(params["threshold"]),
-        ]
-        if params["source_flag"] == "image":
-            cmd.extend(["--image", str(params["source_path"])])
-        else:
-            cmd.extend(["--folder", str(params["source_path"])])
+            self._pending_echo = display
+
+    def _append_output(self, text: str) -> None:
+        # Progress lines drive the progress bar instead of flooding the output panel.
+        lines: list[str] = []
+        for line in text.split("\n"):
+            match = _PROGRESS_PATTERN.match(line)
+            if match:
+                self.progress_bar.setRange(0, int(match[2]))
+                self.progress_bar.setValue(int(match[1]))
+            else:
+                lines.append(line)
+        if lines:
+            self._append_bulk(lines)
+
+    def _append_bulk(self, lines: list[str]) -> None:
+        """Append ``lines`` as new paragraphs with one insert and one repaint."""
+
+        if self._pending_echo is not None:
+            lines = [self._pending_echo, "", *lines]
+            self._pending_echo = None
+        view = self.output_view
+        view.setUpdatesEnabled(False)
+        cursor = view.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        separator = "" if view.document().isEmpty() else "\n"
+        cursor.insertText(separator + "\n".join(lines))
+        view.setUpdatesEnabled(True)
+        scrollbar = view.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def _finish_scan(self) -> None:
+        self.progress_bar.hide()
+        self.scan_button.setEnabled(True)
+        self._refresh_existing_outputs()
 
-        if params["log_enabled"]:
-            cmd.extend(["--log", "results.log"])
+    def _build_command(self, params: _FormValues) -> list[str]:
+        # Re-running with unchanged inputs reuses the previous argv.
+        if self._last_command is not None and self._last_command[0] == params:
+            return self._last_command[1]
+        options: list[tuple[str, str | Path]] = [
+            ("--json", params.layout_path),
+            ("--output", "results.csv"),
+            ("--output-dir", params.results_dir),
+            ("--threshold", str(params.threshold)),
+            ("--image" if params.source_flag == "image" else "--folder", params.source_path),
+        ]
+        if params.log_enabled:
+            options.append(("--log", "results.log"))
+        cmd = [os.fspath(config.PYTHON_EXECUTABLE), os.fspath(self._script_path)]
+        cmd += [part for flag, value in options for part in (flag, os.fspath(value))]
+        cmd.append("--progress")
+        self._last_command = (params, cmd)
         return cmd
 
     def _review_results(self) -> None:
+        # The refresh stats both outputs and clears the paths that no longer exist.
         self._refresh_existing_outputs()
-        if not self._results_csv or not self._results_csv.exists():
+        if not self._results_csv:
             QMessageBox.information(
                 self,
                 "File not found",
@@ -337,7 +439,7 @@ class ScannerGui(QWidget):
 
     def _review_log(self) -> None:
         self._refresh_existing_outputs()
-        if not self._results_log or not self._results_log.exists():
+        if not self._results_log:
             QMessageBox.information(
                 self,
                 "File not found",
@@ -347,17 +449,16 @@ class ScannerGui(QWidget):
         self._open_path(self._results_log)
 
     def _refresh_existing_outputs(self) -> None:
-        active_folder = config.active_test_folder()
-        if not active_folder:
+        if not config.ACTIVE_TEST_NAME:
             self._results_csv = None
             self._results_log = None
             self.review_results_button.setEnabled(False)
             self.review_log_button.setEnabled(False)
             return
 
-        results_dir = active_folder / "results"
-        csv_candidate = results_dir / "results.csv"
-        log_candidate = results_dir / "results.log"
+        paths = _scanner_paths(config.ACTIVE_TEST_NAME)
+        csv_candidate = paths.results_csv
+        log_candidate = paths.results_log
 
         if csv_candidate.exists():
             self._results_csv = csv_candidate
@@ -374,18 +475,16 @@ class ScannerGui(QWidget):
             self.review_log_button.setEnabled(False)
 
     def _open_path(self, path: Path) -> None:
-        try:
-            if sys.platform.startswith("win"):
-                subprocess.Popen(["cmd", "/c", "start", "", str(path)])
-            elif sys.platform == "darwin":
-                subprocess.Popen(["open", str(path)])
-            else:
-                subprocess.Popen(["xdg-open", str(path)])
-        except OSError as exc:  # noqa: PERF203
-            QMessageBox.critical(self, "Viewer error", f"Could not open {path}: {exc}")
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(path))):
+            QMessageBox.critical(self, "Viewer error", f"Could not open {path}: no application is registered for it.")
 
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
+        if self._pending_echo is not None:
+            self._append_bulk([])
+        # A scan in flight owns the scan button and the output panel.
+        if self._worker.is_busy():
+            return
         self._evaluate_source_state(show_message=True)
         self._refresh_existing_outputs()
 
@@ -395,11 +494,13 @@ class ScannerGui(QWidget):
         self.custom_browse.setEnabled(use_custom)
         self._evaluate_source_state(show_message=True)
 
+    def _handle_custom_text_changed(self, _text: str) -> None:
+        self._evaluate_source_state(show_message=True)
+
     def _evaluate_source_state(self, show_message: bool) -> bool:
-        active_folder = config.active_test_folder()
-        exam_title = config.extract_exam_title()
+        paths = _scanner_paths(config.ACTIVE_TEST_NAME) if config.ACTIVE_TEST_NAME else None
 
-        if not active_folder or not exam_title:
+        if paths is None or paths.layout_json is None:
             self._source_path = None
             self._layout_path = None
             self.scan_button.setEnabled(False)
@@ -408,10 +509,10 @@ class ScannerGui(QWidget):
                 self._set_status_message("No test selected. Open the Test Manager tab and choose a test.", replace=True)
             return False
 
-        default_path = self._default_images_dir()
+        default_path = paths.images_dir
         self.default_path_display.setText(str(default_path))
-        layout_path = config.layout_json_path(active_folder, exam_title)
-        if not layout_path or not layout_path.exists():
+        layout_path = paths.layout_json
+        if not layout_path.exists():
             self._source_path = None
             self._layout_path = None
             self.scan_button.setEnabled(False)
@@ -459,14 +560,3 @@ class ScannerGui(QWidget):
             self.output_view.setPlainText(message)
         else:
             self.output_view.append(message)
-
-
-def shlex_quote(text: str) -> str:
-    """Minimal shlex quoting to display commands in QTextEdit."""
-
-    if not text:
-        return "''"
-    safe = "-._/:"
-    if all(ch.isalnum() or ch in safe for ch in text):
-        return text
-    return "'" + text.replace("'", "'\"'\"'") + "'"
@@ -22,7 +22,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-_VALID_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+_VALID_NAME = re.compile(r"[A-Za-z0-9_-]+")
 _SUBDIRECTORIES = [
     Path("inputs"),
     Path("inputs/scans"),
@@ -34,6 +34,11 @@ _SUBDIRECTORIES = [
     Path("miss_analysis"),
     Path("adjustments"),
 ]
+# Only the deepest folders need an explicit mkdir; parents=True creates the rest
+# (e.g. "inputs" comes with "inputs/scans").
+_LEAF_SUBDIRECTORIES = tuple(
+    subdir for subdir in _SUBDIRECTORIES if not any(subdir in other.parents for other in _SUBDIRECTORIES)
+)
 
 
 class TestManagerGui(QWidget):
@@ -173,7 +178,7 @@ class TestManagerGui(QWidget):
             )
 
         folder_path.mkdir(parents=True, exist_ok=False)
-        for subdir in _SUBDIRECTORIES:
+        for subdir in _LEAF_SUBDIRECTORIES:
             (folder_path / subdir).mkdir(parents=True, exist_ok=True)
 
         return folder_name, folder_path